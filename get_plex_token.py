@@ -7,8 +7,13 @@ Your credentials are NOT stored - they're only used to authenticate once.
 """
 
 import getpass
-import requests
-from xml.etree import ElementTree
+import re
+
+import httpx
+
+# The sign-in response is only needed for this one attribute
+AUTH_TOKEN_RE = re.compile(rb'authToken="([^"]+)"')
+
 
 def get_plex_token():
     """Get Plex token by authenticating with username/password."""
@@ -30,15 +35,16 @@ def get_plex_token():
 
     try:
         # Authenticate with Plex
-        response = requests.post(
-            'https://plex.tv/users/sign_in.xml',
-            auth=(username, password),
-            headers={
-                'X-Plex-Client-Identifier': 'PodcastManager',
-                'X-Plex-Product': 'Podcast Manager',
-                'X-Plex-Version': '1.0'
-            }
-        )
+        with httpx.Client(timeout=30) as client:
+            response = client.post(
+                'https://plex.tv/users/sign_in.xml',
+                auth=(username, password),
+                headers={
+                    'X-Plex-Client-Identifier': 'PodcastManager',
+                    'X-Plex-Product': 'Podcast Manager',
+                    'X-Plex-Version': '1.0'
+                }
+            )
 
         if response.status_code == 401:
             print("❌ Authentication failed - incorrect username or password")
@@ -48,9 +54,9 @@ def get_plex_token():
             print(f"❌ Error: {response.status_code} - {response.text}")
             return None
 
-        # Parse XML response
-        root = ElementTree.fromstring(response.content)
-        token = root.get('authToken')
+        # Extract the token from the XML response
+        match = AUTH_TOKEN_RE.search(response.content)
+        token = match.group(1).decode() if match else None
 
         if token:
             print()
@@ -68,7 +74,7 @@ def get_plex_token():
             print("❌ Could not find token in response")
             return None
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"❌ Network error: {e}")
         return None
     except Exception as e:
@@ -6,13 +6,14 @@ This script creates the database tables and optionally seeds initial data.
 
 import asyncio
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add src to path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from podcastmanager.config import get_settings
-from podcastmanager.db.database import init_db
+from podcastmanager.db.database import bulk_copy, init_db
 from podcastmanager.db.models import Setting
 from podcastmanager.utils.logging import setup_logging
 from loguru import logger
@@ -40,15 +41,20 @@ async def create_default_settings(db_manager):
             logger.info(f"Found {len(existing_settings)} existing settings, skipping defaults")
             return
 
-        # Create default settings
+        # Create default settings in one bulk write (COPY on PostgreSQL)
         logger.info("Creating default settings...")
-        for key, value in DEFAULT_SETTINGS.items():
-            setting = Setting(
-                key=key,
-                value=value,
-                description=f"Default setting for {key.replace('_', ' ')}",
-            )
-            session.add(setting)
+        now = datetime.utcnow()
+        rows = [
+            {
+                "key": key,
+                "value": value,
+                "description": f"Default setting for {key.replace('_', ' ')}",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for key, value in DEFAULT_SETTINGS.items()
+        ]
+        await bulk_copy(session, Setting, rows)
 
         await session.commit()
         logger.success(f"Created {len(DEFAULT_SETTINGS)} default settings")
@@ -66,7 +72,7 @@ async def main():
 
     # Initialize database manager
     logger.info(f"Database URL: {settings.database_url}")
-    db_manager = init_db(settings.database_url, echo=True)
+    db_manager = init_db(settings.database_url, echo=settings.debug)
 
     try:
         # Create all tables
@@ -5,25 +5,62 @@ This module provides FastAPI dependencies for injecting services
 and other components into route handlers.
 """
 
-from typing import AsyncGenerator
-
-from fastapi import Depends
+import httpx
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from podcastmanager.core.podcast_manager import PodcastManager
 from podcastmanager.db.database import get_db
+from podcastmanager.tasks.worker import TaskScheduler, get_scheduler
+
+
+async def get_http(request: Request) -> httpx.AsyncClient:
+    """
+    Dependency to get the shared HTTP client.
+
+    Args:
+        request: Incoming request (injected)
+
+    Returns:
+        httpx.AsyncClient: HTTP client installed on the app during startup
+    """
+    return request.app.state.http
 
 
 async def get_podcast_manager(
     session: AsyncSession = Depends(get_db),
-) -> AsyncGenerator[PodcastManager, None]:
+    http: httpx.AsyncClient = Depends(get_http),
+) -> PodcastManager:
     """
     Dependency to get a PodcastManager instance.
 
+    The session lifecycle is owned by get_db, so this dependency simply
+    returns the manager instead of wrapping it in a generator.
+
     Args:
         session: Database session (injected)
+        http: Shared HTTP client (injected)
 
-    Yields:
+    Returns:
         PodcastManager: Podcast manager service
     """
-    yield PodcastManager(session)
+    return PodcastManager(session, http_client=http)
+
+
+def require_scheduler() -> TaskScheduler:
+    """
+    Dependency to get the background task scheduler.
+
+    Returns:
+        TaskScheduler: The running task scheduler
+
+    Raises:
+        HTTPException: 503 if the scheduler hasn't been initialized
+    """
+    try:
+        return get_scheduler()
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Scheduler not initialized",
+        )
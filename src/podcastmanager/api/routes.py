@@ -5,15 +5,30 @@ This module defines all REST API endpoints for managing podcasts, episodes,
 and downloads.
 """
 
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
-from fastapi.responses import Response
+import asyncio
+import hashlib
+from typing import AsyncIterator, List, Optional
+
+import httpx
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from loguru import logger
+from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from podcastmanager.api.dependencies import get_podcast_manager
+from podcastmanager.api.dependencies import get_http, get_podcast_manager, require_scheduler
 from podcastmanager.api.schemas import (
     DownloadListResponse,
     DownloadResponse,
@@ -28,14 +43,137 @@ from podcastmanager.api.schemas import (
     PodcastResponse,
     PodcastUpdate,
     PodcastWithEpisodesResponse,
+    orm_to_dict,
+)
+from podcastmanager.core.download_engine import DownloadEngine, get_download_worker
+from podcastmanager.core.exceptions import (
+    EpisodeNotFoundException,
+    InsufficientStorageException,
 )
 from podcastmanager.core.podcast_manager import PodcastManager
-from podcastmanager.db.database import get_db
+from podcastmanager.db.database import get_db, get_db_manager
 from podcastmanager.db.models import Episode, Podcast
 from podcastmanager.services.opml import OPMLService
+from podcastmanager.tasks.worker import TaskScheduler, get_scheduler
 
 # Create API router
-router = APIRouter(prefix="/api", tags=["api"])
+# JSON endpoints are encoded with orjson; endpoints that build their own
+# Response (e.g. OPML export) are unaffected
+router = APIRouter(prefix="/api", tags=["api"], default_response_class=ORJSONResponse)
+
+# Maximum number of feeds fetched concurrently during an OPML import
+OPML_IMPORT_CONCURRENCY = 10
+
+# Maximum number of feed URLs per duplicate-check query
+OPML_LOOKUP_CHUNK_SIZE = 500
+
+# Rows fetched per round trip when streaming the OPML export
+OPML_EXPORT_BATCH_SIZE = 500
+
+# Rows fetched per round trip when exporting downloads
+DOWNLOAD_EXPORT_BATCH_SIZE = 500
+
+
+def _model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize an already built response model.
+
+    Returning a Response makes FastAPI skip its own response_model validation,
+    so the payload is validated at most once (by the caller) and encoded by
+    pydantic's JSON serializer. The route's response_model still documents
+    the schema.
+
+    Args:
+        model: Response model instance (validated or built from trusted data)
+        status_code: HTTP status code
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def _podcasts_etag(session: AsyncSession) -> str:
+    """
+    Compute an ETag for the current set of podcast subscriptions.
+
+    The tag changes whenever a podcast is added, removed or updated, so it can
+    be checked with one cheap aggregate query before doing any real work.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Quoted ETag value
+    """
+    result = await session.execute(
+        select(func.count(Podcast.id), func.max(Podcast.id), func.max(Podcast.updated_at))
+    )
+    count, max_id, last_updated = result.one()
+    digest = hashlib.blake2b(
+        f"{count}:{max_id}:{last_updated}".encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+async def _start_stream(chunks: AsyncIterator[bytes], what: str) -> AsyncIterator[bytes]:
+    """
+    Produce the first chunk of a streamed body before the response starts.
+
+    An error raised while producing the first chunk propagates to the caller,
+    so it can still become an error response instead of a 200 with a
+    truncated body. Errors raised later cannot change the status any more:
+    they are logged and re-raised, which aborts the response so the client
+    sees an incomplete transfer rather than a short, complete-looking one.
+
+    Args:
+        chunks: Async iterator producing the body
+        what: Description of the body, for log messages
+
+    Returns:
+        Async iterator producing the whole body
+    """
+    try:
+        first = await chunks.__anext__()
+    except StopAsyncIteration:
+        first = b""
+    except BaseException:
+        await chunks.aclose()
+        raise
+
+    async def body() -> AsyncIterator[bytes]:
+        yield first
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming {what}: {e}")
+            raise
+
+    return body()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match header matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag value
+
+    Returns:
+        True if the client already has the current representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
 
 
 # ============================================================================
@@ -80,7 +218,7 @@ async def create_podcast(
                 detail="Failed to fetch or parse RSS feed. Please check the URL.",
             )
 
-        return podcast
+        return _model_response(PodcastResponse.model_validate(podcast), status.HTTP_201_CREATED)
 
     except Exception as e:
         logger.error(f"Error creating podcast: {e}")
@@ -97,32 +235,48 @@ async def create_podcast(
     description="Get a paginated list of all subscribed podcasts",
 )
 async def list_podcasts(
+    request: Request,
     skip: int = Query(default=0, ge=0, description="Number of items to skip"),
     limit: int = Query(default=100, ge=1, le=100, description="Maximum number of items to return"),
     session: AsyncSession = Depends(get_db),
 ):
     """
     Get a list of all podcasts with pagination.
+
+    Supports conditional requests: a matching If-None-Match returns 304.
     """
-    # Get total count
-    count_result = await session.execute(select(func.count(Podcast.id)))
-    total = count_result.scalar_one()
+    etag = await _podcasts_etag(session)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-    # Get podcasts
+    # Get podcasts with the total count computed by a window function
     result = await session.execute(
-        select(Podcast)
+        select(Podcast, func.count().over().label("total"))
         .order_by(Podcast.title)
         .offset(skip)
         .limit(limit)
     )
-    podcasts = list(result.scalars().all())
-
-    return PodcastListResponse(
-        podcasts=podcasts,
-        total=total,
-        skip=skip,
-        limit=limit,
-    )
+    rows = result.all()
+    podcasts = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end: fall back to a plain count
+        count_result = await session.execute(select(func.count(Podcast.id)))
+        total = count_result.scalar_one()
+    else:
+        total = 0
+
+    # Trusted DB rows are encoded directly with orjson; PodcastListResponse
+    # only documents the schema
+    page = {
+        "podcasts": [orm_to_dict(p, PodcastResponse) for p in podcasts],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+    }
+    return ORJSONResponse(page, headers={"ETag": etag})
 
 
 @router.get(
@@ -149,7 +303,7 @@ async def get_podcast(
             detail=f"Podcast with ID {podcast_id} not found",
         )
 
-    return podcast
+    return _model_response(PodcastResponse.from_orm_trusted(podcast))
 
 
 @router.put(
@@ -181,7 +335,7 @@ async def update_podcast(
             detail=f"Podcast with ID {podcast_id} not found",
         )
 
-    return podcast
+    return _model_response(PodcastResponse.model_validate(podcast))
 
 
 @router.delete(
@@ -267,40 +421,46 @@ async def list_episodes(
     """
     Get a list of episodes for a podcast with pagination.
     """
-    # Check if podcast exists
-    podcast_result = await session.execute(
-        select(Podcast).where(Podcast.id == podcast_id)
-    )
-    podcast = podcast_result.scalar_one_or_none()
-
-    if not podcast:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Podcast with ID {podcast_id} not found",
-        )
-
-    # Get total count
-    count_result = await session.execute(
-        select(func.count(Episode.id)).where(Episode.podcast_id == podcast_id)
-    )
-    total = count_result.scalar_one()
-
-    # Get episodes
+    # Get episodes with the total count computed by a window function
     result = await session.execute(
-        select(Episode)
+        select(Episode, func.count().over().label("total"))
         .where(Episode.podcast_id == podcast_id)
         .order_by(Episode.pub_date.desc())
         .offset(skip)
         .limit(limit)
     )
-    episodes = list(result.scalars().all())
+    rows = result.all()
+    episodes = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0].total
+    else:
+        # Only an empty page needs to tell a missing podcast apart from one
+        # without (further) episodes
+        podcast_result = await session.execute(
+            select(Podcast.id).where(Podcast.id == podcast_id)
+        )
+        if podcast_result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Podcast with ID {podcast_id} not found",
+            )
 
-    return EpisodeListResponse(
-        episodes=episodes,
-        total=total,
-        skip=skip,
-        limit=limit,
-    )
+        total = 0
+        if skip:
+            # Page past the end: fall back to a plain count
+            count_result = await session.execute(
+                select(func.count(Episode.id)).where(Episode.podcast_id == podcast_id)
+            )
+            total = count_result.scalar_one()
+
+    # Encode trusted DB rows directly, as in list_podcasts
+    return ORJSONResponse({
+        "episodes": [orm_to_dict(e, EpisodeResponse) for e in episodes],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+    })
 
 
 @router.get(
@@ -330,7 +490,7 @@ async def get_episode(
             detail=f"Episode with ID {episode_id} not found",
         )
 
-    return episode
+    return _model_response(EpisodeResponse.from_orm_trusted(episode))
 
 
 # ============================================================================
@@ -342,19 +502,23 @@ async def get_episode(
     "/podcasts/{podcast_id}/with-episodes",
     response_model=PodcastWithEpisodesResponse,
     summary="Get podcast with episodes",
-    description="Get podcast details along with all its episodes",
+    description="Get podcast details along with its most recent episodes",
     responses={
         404: {"model": ErrorResponse, "description": "Podcast not found"},
     },
 )
 async def get_podcast_with_episodes(
     podcast_id: int,
+    limit: int = Query(default=100, ge=1, le=100, description="Maximum number of episodes to return"),
     podcast_manager: PodcastManager = Depends(get_podcast_manager),
 ):
     """
-    Get a podcast with all its episodes loaded.
+    Get a podcast with its most recent episodes loaded.
+
+    Episodes are paged rather than loaded in full, so large archives don't
+    grow the response without bound.
     """
-    podcast = await podcast_manager.get_podcast_with_episodes(podcast_id)
+    podcast = await podcast_manager.get_podcast_by_id(podcast_id)
 
     if not podcast:
         raise HTTPException(
@@ -362,7 +526,9 @@ async def get_podcast_with_episodes(
             detail=f"Podcast with ID {podcast_id} not found",
         )
 
-    return podcast
+    episodes = await podcast_manager.get_podcast_episodes(podcast_id, limit=limit)
+
+    return _model_response(PodcastWithEpisodesResponse.from_orm_trusted(podcast, episodes))
 
 
 # ============================================================================
@@ -389,16 +555,10 @@ async def queue_download(
     """
     Queue an episode for download.
     """
-    from podcastmanager.core.download_engine import DownloadEngine
-    from podcastmanager.core.exceptions import (
-        EpisodeNotFoundException,
-        InsufficientStorageException,
-    )
-
     try:
         engine = DownloadEngine(session)
         download = await engine.queue_episode_download(episode_id)
-        return download
+        return _model_response(DownloadResponse.model_validate(download), status.HTTP_201_CREATED)
 
     except EpisodeNotFoundException as e:
         logger.error(f"Episode not found: {episode_id} - {str(e)}")
@@ -441,29 +601,52 @@ async def list_downloads(
     """
     Get a list of all downloads with pagination.
     """
-    from podcastmanager.core.download_engine import DownloadEngine
-    from podcastmanager.db.models import Download
-
     engine = DownloadEngine(session)
 
-    # Get total count
-    query = select(func.count(Download.id))
-    if status_filter:
-        query = query.where(Download.status == status_filter)
-    count_result = await session.execute(query)
-    total = count_result.scalar_one()
-
-    # Get downloads
-    downloads = await engine.get_all_downloads(
+    # Get downloads along with the total count
+    downloads, total = await engine.get_downloads_page(
         status=status_filter, skip=skip, limit=limit
     )
 
-    return DownloadListResponse(
-        downloads=downloads,
-        total=total,
-        skip=skip,
-        limit=limit,
-    )
+    # Encode trusted DB rows directly, as in list_podcasts
+    return ORJSONResponse({
+        "downloads": [orm_to_dict(d, DownloadResponse) for d in downloads],
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+    })
+
+
+@router.get(
+    "/downloads/export",
+    summary="Export all downloads",
+    description="Stream every download, optionally filtered by status, as JSON lines",
+    response_class=StreamingResponse,
+)
+async def export_downloads(
+    status_filter: Optional[str] = Query(
+        None,
+        alias="status",
+        description="Filter by status (pending, downloading, completed, failed, deleted)",
+    ),
+):
+    """
+    Stream all downloads as newline-delimited JSON.
+
+    Unlike the paginated listing, the full result set is never held in memory.
+    """
+    db_manager = get_db_manager()
+
+    async def stream_lines():
+        # Streaming bodies outlive request-scoped sessions, so own one here
+        async with db_manager.async_session_maker() as stream_session:
+            engine = DownloadEngine(stream_session)
+            async for download in engine.stream_downloads(
+                status=status_filter, batch_size=DOWNLOAD_EXPORT_BATCH_SIZE
+            ):
+                yield orjson.dumps(orm_to_dict(download, DownloadResponse)) + b"\n"
+
+    return StreamingResponse(stream_lines(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -482,8 +665,6 @@ async def get_download(
     """
     Get the status of a specific download.
     """
-    from podcastmanager.core.download_engine import DownloadEngine
-
     engine = DownloadEngine(session)
     download = await engine.get_download_status(download_id)
 
@@ -493,7 +674,7 @@ async def get_download(
             detail=f"Download with ID {download_id} not found",
         )
 
-    return download
+    return _model_response(DownloadResponse.from_orm_trusted(download))
 
 
 @router.delete(
@@ -516,8 +697,6 @@ async def delete_download(
     """
     Delete a download and optionally the file.
     """
-    from podcastmanager.core.download_engine import DownloadEngine
-
     engine = DownloadEngine(session)
     success = await engine.delete_download(download_id, delete_file=delete_file)
 
@@ -533,25 +712,50 @@ async def delete_download(
     )
 
 
+async def _run_download_queue() -> None:
+    """Process pending downloads in the background with a dedicated session."""
+    try:
+        download_worker = get_download_worker()
+    except RuntimeError:
+        download_worker = None
+
+    try:
+        if download_worker is not None and download_worker.is_running:
+            # Let the running worker pick up anything it doesn't know about yet
+            await download_worker.try_poll_once()
+        else:
+            async with get_db_manager().async_session_maker() as session:
+                await DownloadEngine(session).process_download_queue()
+    except Exception as e:
+        logger.error(f"Background download queue processing failed: {e}")
+
+
+async def _run_retry_failed() -> None:
+    """Retry failed downloads in the background with a dedicated session."""
+    try:
+        async with get_db_manager().async_session_maker() as session:
+            await DownloadEngine(session).retry_failed_downloads()
+    except Exception as e:
+        logger.error(f"Background retry of failed downloads failed: {e}")
+
+
 @router.post(
     "/downloads/process-queue",
     response_model=MessageResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Process download queue",
-    description="Manually trigger processing of pending downloads",
+    description="Manually trigger processing of pending downloads in the background",
 )
-async def process_queue(
-    session: AsyncSession = Depends(get_db),
-):
-    """
-    Process all pending downloads in the queue.
+async def process_queue(background_tasks: BackgroundTasks):
     """
-    from podcastmanager.core.download_engine import DownloadEngine
+    Start processing all pending downloads in the queue.
 
-    engine = DownloadEngine(session)
-    processed = await engine.process_download_queue()
+    Returns immediately; poll /downloads/{download_id} for progress.
+    """
+    background_tasks.add_task(_run_download_queue)
 
     return MessageResponse(
-        message=f"Processed {processed} downloads from queue",
+        message="Queue processing started",
         success=True,
     )
 
@@ -559,22 +763,20 @@ async def process_queue(
 @router.post(
     "/downloads/retry-failed",
     response_model=MessageResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Retry failed downloads",
-    description="Retry all failed downloads that haven't exceeded max retries",
+    description="Retry all failed downloads that haven't exceeded max retries, in the background",
 )
-async def retry_failed(
-    session: AsyncSession = Depends(get_db),
-):
+async def retry_failed(background_tasks: BackgroundTasks):
     """
-    Retry failed downloads.
-    """
-    from podcastmanager.core.download_engine import DownloadEngine
+    Start retrying failed downloads.
 
-    engine = DownloadEngine(session)
-    retried = await engine.retry_failed_downloads()
+    Returns immediately; poll /downloads/{download_id} for progress.
+    """
+    background_tasks.add_task(_run_retry_failed)
 
     return MessageResponse(
-        message=f"Retried {retried} failed downloads",
+        message="Retry of failed downloads started",
         success=True,
     )
 
@@ -603,19 +805,16 @@ async def parse_opml(
     It does not add them to the database. Use /opml/import to add the podcasts.
     """
     try:
-        # Read file contents
-        contents = await file.read()
-
-        # Validate OPML
-        if not OPMLService.validate_opml(contents):
+        # Validate and parse the upload incrementally, off the event loop
+        await file.seek(0)
+        try:
+            podcasts = await asyncio.to_thread(OPMLService.parse_opml_stream, file.file)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid OPML file format",
+                detail=f"Invalid OPML file format: {e}",
             )
 
-        # Parse OPML
-        podcasts = OPMLService.parse_opml(contents)
-
         return OPMLImportResponse(
             podcasts_found=len(podcasts),
             podcasts=[OPMLPodcastInfo(**p) for p in podcasts],
@@ -653,62 +852,81 @@ async def import_opml(
         default=True,
         description="Enable auto-download for imported podcasts",
     ),
-    podcast_manager: PodcastManager = Depends(get_podcast_manager),
+    session: AsyncSession = Depends(get_db),
+    http: httpx.AsyncClient = Depends(get_http),
 ):
     """
     Import podcasts from an OPML file.
 
     This will:
     - Parse the OPML file
-    - Add each podcast to the database
-    - Skip podcasts that are already subscribed
+    - Skip podcasts that are already subscribed (checked with a single query)
+    - Fetch and add the remaining podcasts concurrently
     """
     try:
-        # Read file contents
-        contents = await file.read()
-
-        # Validate OPML
-        if not OPMLService.validate_opml(contents):
+        # Validate and parse the upload incrementally, off the event loop
+        await file.seek(0)
+        try:
+            podcasts = await asyncio.to_thread(OPMLService.parse_opml_stream, file.file)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid OPML file format",
+                detail=f"Invalid OPML file format: {e}",
             )
 
-        # Parse OPML
-        podcasts = OPMLService.parse_opml(contents)
+        # Find podcasts that are already subscribed, chunking the IN list to
+        # stay under the database's bound-parameter limit
+        urls = [p['rss_url'] for p in podcasts]
+        existing_urls = set()
+        for i in range(0, len(urls), OPML_LOOKUP_CHUNK_SIZE):
+            result = await session.execute(
+                select(Podcast.rss_url).where(
+                    Podcast.rss_url.in_(urls[i:i + OPML_LOOKUP_CHUNK_SIZE])
+                )
+            )
+            existing_urls.update(result.scalars().all())
 
-        # Add each podcast
-        added = 0
         skipped = 0
-        errors = 0
-
+        new_podcasts = []
         for podcast_info in podcasts:
-            try:
-                # Check if podcast already exists
-                existing = await podcast_manager.get_podcast_by_rss_url(podcast_info['rss_url'])
-
-                if existing:
-                    skipped += 1
-                    logger.info(f"Skipped podcast (already exists): {podcast_info['title']}")
-                    continue
-
-                # Add new podcast
-                podcast = await podcast_manager.add_podcast_from_rss(
-                    rss_url=podcast_info['rss_url'],
-                    max_episodes_to_keep=max_episodes_to_keep,
-                    auto_download=auto_download,
-                )
-
-                if podcast:
-                    added += 1
-                    logger.info(f"Added podcast from OPML: {podcast_info['title']}")
-                else:
-                    skipped += 1
-                    logger.warning(f"Skipped podcast (invalid feed): {podcast_info['title']}")
+            if podcast_info['rss_url'] in existing_urls:
+                skipped += 1
+                logger.info(f"Skipped podcast (already exists): {podcast_info['title']}")
+            else:
+                # Also guards against the same feed being listed twice in the file
+                existing_urls.add(podcast_info['rss_url'])
+                new_podcasts.append(podcast_info)
+
+        # Fetch feeds concurrently; each add gets its own session since an
+        # AsyncSession cannot be shared between concurrent tasks
+        db_manager = get_db_manager()
+        semaphore = asyncio.Semaphore(OPML_IMPORT_CONCURRENCY)
+
+        async def _add(podcast_info):
+            async with semaphore:
+                async with db_manager.async_session_maker() as add_session:
+                    return await PodcastManager(add_session, http_client=http).add_podcast_from_rss(
+                        rss_url=podcast_info['rss_url'],
+                        max_episodes_to_keep=max_episodes_to_keep,
+                        auto_download=auto_download,
+                    )
+
+        results = await asyncio.gather(
+            *(_add(p) for p in new_podcasts), return_exceptions=True
+        )
 
-            except Exception as e:
+        added = 0
+        errors = 0
+        for podcast_info, podcast in zip(new_podcasts, results):
+            if isinstance(podcast, Exception):
                 errors += 1
-                logger.error(f"Error adding podcast {podcast_info['title']}: {e}")
+                logger.error(f"Error adding podcast {podcast_info['title']}: {podcast}")
+            elif podcast:
+                added += 1
+                logger.info(f"Added podcast from OPML: {podcast_info['title']}")
+            else:
+                skipped += 1
+                logger.warning(f"Skipped podcast (invalid feed): {podcast_info['title']}")
 
         return MessageResponse(
             message=f"OPML import complete: {added} added, {skipped} skipped, {errors} errors",
@@ -729,35 +947,59 @@ async def import_opml(
     "/opml/export",
     summary="Export podcasts to OPML",
     description="Download an OPML file containing all current podcast subscriptions",
-    response_class=Response,
+    response_class=StreamingResponse,
 )
 async def export_opml(
+    request: Request,
     session: AsyncSession = Depends(get_db),
 ):
     """
     Export all subscribed podcasts to an OPML file.
 
     Returns an OPML XML file that can be imported into other podcast applications.
+    Supports conditional requests: a matching If-None-Match returns 304.
     """
     try:
-        # Get all podcasts
-        result = await session.execute(
-            select(Podcast).order_by(Podcast.title)
+        etag = await _podcasts_etag(session)
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        # Only the columns written to the OPML are needed, so skip ORM hydration
+        query = (
+            select(
+                Podcast.title,
+                Podcast.rss_url,
+                Podcast.description,
+                Podcast.website_url,
+            )
+            .order_by(Podcast.title)
+            .execution_options(yield_per=OPML_EXPORT_BATCH_SIZE)
         )
-        podcasts = list(result.scalars().all())
-
-        # Generate OPML
-        opml_content = OPMLService.generate_opml(
-            podcasts=podcasts,
-            title="Podcast Manager Subscriptions",
+        db_manager = get_db_manager()
+
+        async def stream_rows():
+            # The request-scoped session is closed before a streaming body is
+            # sent, so the rows are streamed from a session owned by the body
+            async with db_manager.async_session_maker() as stream_session:
+                result = await stream_session.stream(query)
+                async for row in result:
+                    yield row
+
+        # Stream the OPML as rows arrive from the server-side cursor. The
+        # first chunk is produced here, so early failures are still a 500
+        body = await _start_stream(
+            OPMLService.generate_opml_stream(
+                stream_rows(),
+                title="Podcast Manager Subscriptions",
+            ),
+            "OPML export",
         )
-
-        # Return as downloadable file
-        return Response(
-            content=opml_content,
+        return StreamingResponse(
+            body,
             media_type="application/xml",
             headers={
-                "Content-Disposition": "attachment; filename=podcast_subscriptions.opml"
+                "Content-Disposition": "attachment; filename=podcast_subscriptions.opml",
+                "ETag": etag,
             },
         )
 
@@ -783,14 +1025,20 @@ async def list_jobs():
     """
     Get information about scheduled background jobs.
     """
-    from podcastmanager.tasks.worker import get_scheduler
-
     try:
         scheduler = get_scheduler()
-        jobs = scheduler.get_jobs()
-        return {"jobs": jobs}
     except RuntimeError:
-        return {"jobs": [], "message": "Scheduler not initialized"}
+        return ORJSONResponse({"jobs": [], "message": "Scheduler not initialized"})
+
+    return ORJSONResponse({"jobs": scheduler.get_jobs()})
+
+
+def _job_not_found(job_id: str) -> HTTPException:
+    """Build the 404 raised when a job ID is unknown to the scheduler."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Job '{job_id}' not found",
+    )
 
 
 @router.post(
@@ -799,31 +1047,20 @@ async def list_jobs():
     summary="Trigger a job",
     description="Manually trigger a background job to run immediately",
 )
-async def trigger_job(job_id: str):
+async def trigger_job(
+    job_id: str,
+    scheduler: TaskScheduler = Depends(require_scheduler),
+):
     """
     Manually trigger a background job.
     """
-    from podcastmanager.tasks.worker import get_scheduler
+    if not scheduler.trigger_job(job_id):
+        raise _job_not_found(job_id)
 
-    try:
-        scheduler = get_scheduler()
-        success = scheduler.trigger_job(job_id)
-
-        if success:
-            return MessageResponse(
-                message=f"Job '{job_id}' triggered successfully",
-                success=True,
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job '{job_id}' not found",
-            )
-    except RuntimeError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Scheduler not initialized",
-        )
+    return MessageResponse(
+        message=f"Job '{job_id}' triggered successfully",
+        success=True,
+    )
 
 
 @router.post(
@@ -832,31 +1069,20 @@ async def trigger_job(job_id: str):
     summary="Pause a job",
     description="Pause a scheduled background job",
 )
-async def pause_job(job_id: str):
+async def pause_job(
+    job_id: str,
+    scheduler: TaskScheduler = Depends(require_scheduler),
+):
     """
     Pause a background job.
     """
-    from podcastmanager.tasks.worker import get_scheduler
+    if not scheduler.pause_job(job_id):
+        raise _job_not_found(job_id)
 
-    try:
-        scheduler = get_scheduler()
-        success = scheduler.pause_job(job_id)
-
-        if success:
-            return MessageResponse(
-                message=f"Job '{job_id}' paused successfully",
-                success=True,
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job '{job_id}' not found",
-            )
-    except RuntimeError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Scheduler not initialized",
-        )
+    return MessageResponse(
+        message=f"Job '{job_id}' paused successfully",
+        success=True,
+    )
 
 
 @router.post(
@@ -865,28 +1091,17 @@ async def pause_job(job_id: str):
     summary="Resume a job",
     description="Resume a paused background job",
 )
-async def resume_job(job_id: str):
+async def resume_job(
+    job_id: str,
+    scheduler: TaskScheduler = Depends(require_scheduler),
+):
     """
     Resume a paused background job.
     """
-    from podcastmanager.tasks.worker import get_scheduler
-
-    try:
-        scheduler = get_scheduler()
-        success = scheduler.resume_job(job_id)
+    if not scheduler.resume_job(job_id):
+        raise _job_not_found(job_id)
 
-        if success:
-            return MessageResponse(
-                message=f"Job '{job_id}' resumed successfully",
-                success=True,
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Job '{job_id}' not found",
-            )
-    except RuntimeError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Scheduler not initialized",
-        )
+    return MessageResponse(
+        message=f"Job '{job_id}' resumed successfully",
+        success=True,
+    )
@@ -6,9 +6,43 @@ providing automatic validation and documentation.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Type
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+
+
+def orm_to_dict(obj: Any, schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Read a response schema's fields from a trusted ORM object.
+
+    Data loaded from the database is already well-typed, so it can be encoded
+    directly (e.g. with orjson) without running Pydantic validation.
+
+    Args:
+        obj: SQLAlchemy model instance
+        schema: Response schema whose fields should be read
+
+    Returns:
+        Dictionary of field name to value
+    """
+    return {name: getattr(obj, name) for name in schema.model_fields}
+
+
+class TrustedResponse:
+    """Mixin for response schemas that can be built from trusted ORM objects."""
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """
+        Build the schema from an ORM object without running validation.
+
+        Args:
+            obj: SQLAlchemy model instance loaded from the database
+
+        Returns:
+            Schema instance created with model_construct
+        """
+        return cls.model_construct(**orm_to_dict(obj, cls))
 
 
 # ============================================================================
@@ -55,7 +89,7 @@ class PodcastUpdate(BaseModel):
     )
 
 
-class PodcastResponse(PodcastBase):
+class PodcastResponse(PodcastBase, TrustedResponse):
     """Schema for podcast response data."""
 
     id: int = Field(..., description="Podcast ID")
@@ -71,8 +105,7 @@ class PodcastResponse(PodcastBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
     last_checked: Optional[datetime] = Field(None, description="Last feed check timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PodcastListResponse(BaseModel):
@@ -83,6 +116,8 @@ class PodcastListResponse(BaseModel):
     skip: int = Field(..., description="Number of items skipped")
     limit: int = Field(..., description="Maximum items returned")
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # Episode Schemas
@@ -96,7 +131,7 @@ class EpisodeBase(BaseModel):
     description: Optional[str] = Field(None, description="Episode description")
 
 
-class EpisodeResponse(EpisodeBase):
+class EpisodeResponse(EpisodeBase, TrustedResponse):
     """Schema for episode response data."""
 
     id: int = Field(..., description="Episode ID")
@@ -111,8 +146,7 @@ class EpisodeResponse(EpisodeBase):
     season_number: Optional[int] = Field(None, description="Season number")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class EpisodeListResponse(BaseModel):
@@ -123,19 +157,44 @@ class EpisodeListResponse(BaseModel):
     skip: int = Field(..., description="Number of items skipped")
     limit: int = Field(..., description="Maximum items returned")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PodcastWithEpisodesResponse(PodcastResponse):
     """Schema for podcast with episodes included."""
 
     episodes: List[EpisodeResponse] = Field(..., description="List of episodes")
 
+    @classmethod
+    def from_orm_trusted(
+        cls, obj: Any, episodes: Optional[List[Any]] = None
+    ) -> "PodcastWithEpisodesResponse":
+        """
+        Build the schema from an ORM podcast and its episodes.
+
+        model_construct does not recurse, so episodes are constructed here.
+
+        Args:
+            obj: Podcast instance
+            episodes: Episode instances to include (defaults to the podcast's
+                eager loaded episodes)
+
+        Returns:
+            Schema instance created with model_construct
+        """
+        if episodes is None:
+            episodes = obj.episodes
+        data = orm_to_dict(obj, PodcastResponse)
+        data["episodes"] = [EpisodeResponse.from_orm_trusted(e) for e in episodes]
+        return cls.model_construct(**data)
+
 
 # ============================================================================
 # Download Schemas
 # ============================================================================
 
 
-class DownloadResponse(BaseModel):
+class DownloadResponse(BaseModel, TrustedResponse):
     """Schema for download status response."""
 
     id: int = Field(..., description="Download ID")
@@ -151,8 +210,7 @@ class DownloadResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DownloadListResponse(BaseModel):
@@ -163,6 +221,8 @@ class DownloadListResponse(BaseModel):
     skip: int = Field(..., description="Number of items skipped")
     limit: int = Field(..., description="Maximum items returned")
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # Generic Response Schemas
@@ -175,6 +235,8 @@ class MessageResponse(BaseModel):
     message: str = Field(..., description="Response message")
     success: bool = Field(default=True, description="Operation success status")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
@@ -182,6 +244,8 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # Health Check Schema
@@ -195,6 +259,8 @@ class HealthResponse(BaseModel):
     app: str = Field(..., description="Application name")
     version: str = Field(..., description="Application version")
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # OPML Schemas
@@ -216,3 +282,5 @@ class OPMLImportResponse(BaseModel):
     podcasts_found: int = Field(..., description="Number of podcasts found in OPML")
     podcasts: List[OPMLPodcastInfo] = Field(..., description="List of podcasts from OPML")
     message: str = Field(..., description="Status message")
+
+    model_config = ConfigDict(frozen=True)
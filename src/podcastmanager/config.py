@@ -5,6 +5,7 @@ This module uses Pydantic Settings to load and validate configuration
 from environment variables and .env files.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,10 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Log levels accepted by the log_level setting
+_ALLOWED_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -36,6 +41,25 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./podcast_manager.db",
         description="SQLAlchemy database URL",
     )
+    db_pool_size: int = Field(
+        default=20,
+        ge=1,
+        description="Database connection pool size (SQLite writes still take turns on the file lock)",
+    )
+    db_max_overflow: int = Field(
+        default=40,
+        ge=0,
+        description="Connections allowed beyond the pool size under burst load",
+    )
+    db_pool_timeout: int = Field(
+        default=10,
+        ge=1,
+        description="Seconds to wait for a pooled connection before failing",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Recycle pooled connections after this many seconds (not applied to SQLite)",
+    )
 
     # Download settings
     download_base_path: Path = Field(
@@ -156,10 +180,9 @@ class Settings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is one of the allowed values."""
-        allowed_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v = v.upper()
-        if v not in allowed_levels:
-            raise ValueError(f"Log level must be one of: {', '.join(allowed_levels)}")
+        if v not in _ALLOWED_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of: {', '.join(sorted(_ALLOWED_LOG_LEVELS))}")
         return v
 
     def create_directories(self) -> None:
@@ -178,26 +201,21 @@ class Settings(BaseSettings):
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get the global settings instance.
 
-    This function creates a singleton Settings instance that is reused
-    throughout the application.
+    The Settings instance is built (and .env parsed) once and cached, so
+    repeated calls on the request path are a plain cache hit.
 
     Returns:
         Settings: The application settings
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        # Ensure necessary directories exist
-        _settings.create_directories()
-    return _settings
+    settings = Settings()
+    # Ensure necessary directories exist
+    settings.create_directories()
+    return settings
 
 
 def reload_settings() -> Settings:
@@ -209,6 +227,5 @@ def reload_settings() -> Settings:
     Returns:
         Settings: The reloaded settings
     """
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
     return get_settings()
@@ -7,21 +7,26 @@ concurrent downloads, retry logic, and status tracking.
 
 import asyncio
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Set, Tuple, Union
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
+from podcastmanager.config import get_settings
 from podcastmanager.core.exceptions import (
     EpisodeNotFoundException,
     InsufficientStorageException,
 )
-from podcastmanager.db.models import Download, Episode, Podcast
+from podcastmanager.db.database import dialect_insert, get_db_manager
+from podcastmanager.db.models import ACTIVE_DOWNLOADS, Download, Episode, Podcast
 from podcastmanager.services.download_service import get_download_service
 from podcastmanager.services.file_manager import get_file_manager
 
+# Process-wide bound on concurrent transfers, shared by every engine
+_download_semaphore: Optional[asyncio.Semaphore] = None
+
 
 class DownloadEngine:
     """
@@ -55,9 +60,6 @@ class DownloadEngine:
         self.download_service = get_download_service()
         self.file_manager = get_file_manager()
 
-        # Semaphore to limit concurrent downloads
-        self.download_semaphore = asyncio.Semaphore(max_concurrent)
-
     async def queue_episode_download(self, episode_id: int) -> Download:
         """
         Queue an episode for download.
@@ -74,10 +76,10 @@ class DownloadEngine:
             EpisodeNotFoundException: If episode not found
             InsufficientStorageException: If not enough disk space
         """
-        # Get the episode with podcast
+        # Get the episode with its podcast and any existing download in one query
         result = await self.session.execute(
             select(Episode)
-            .options(selectinload(Episode.podcast))
+            .options(joinedload(Episode.podcast), joinedload(Episode.download))
             .where(Episode.id == episode_id)
         )
         episode = result.scalar_one_or_none()
@@ -87,10 +89,7 @@ class DownloadEngine:
             raise EpisodeNotFoundException(f"Episode with ID {episode_id} not found")
 
         # Check if already downloaded or queued
-        result = await self.session.execute(
-            select(Download).where(Download.episode_id == episode_id)
-        )
-        existing = result.scalar_one_or_none()
+        existing = episode.download
 
         if existing:
             if existing.status == "completed":
@@ -98,14 +97,17 @@ class DownloadEngine:
                 return existing
             elif existing.status in ("pending", "downloading"):
                 logger.info(f"Episode already queued: {episode.title}")
+                if existing.status == "pending":
+                    _enqueue_downloads([existing.id])
                 return existing
             else:
                 # Failed or deleted - reset for retry
                 logger.info(f"Retrying download for: {episode.title}")
                 existing.status = "pending"
                 existing.progress = 0.0
-                existing.updated_at = datetime.utcnow()
                 await self.session.commit()
+                self.download_service.status_cache.invalidate(existing.id)
+                _enqueue_downloads([existing.id])
                 return existing
 
         # Generate file path
@@ -130,32 +132,84 @@ class DownloadEngine:
                     available_bytes=available_space,
                 )
 
+            self.file_manager.reserve_space(episode.file_size)
+
         # Create download record
-        download = Download(
+        download = await self._insert_download(
             episode_id=episode_id,
             status="pending",
             file_path=str(relative_path),
             progress=0.0,
             retry_count=0,
         )
-
-        self.session.add(download)
         await self.session.commit()
 
         logger.info(f"Queued download: {episode.title}")
+        # Start the download right away instead of waiting for the next poll
+        _enqueue_downloads([download.id])
         return download
 
-    async def download_episode(self, download_id: int) -> bool:
+    async def _insert_download(self, **values) -> Download:
+        """
+        Insert a download record, tolerating a concurrent insert for the episode.
+
+        Uses INSERT ... ON CONFLICT so that two requests queuing the same
+        episode can't race: a conflicting failed/deleted record is reset to
+        pending, while an active one is left alone and returned as is.
+
+        Args:
+            **values: Column values for the new record
+
+        Returns:
+            The inserted (or already existing) Download record
+        """
+        insert_stmt = dialect_insert(self.session, Download)
+        if insert_stmt is None:
+            download = Download(**values)
+            self.session.add(download)
+            await self.session.flush()
+            return download
+
+        stmt = (
+            insert_stmt.values(**values)
+            .on_conflict_do_update(
+                index_elements=[Download.episode_id],
+                set_={
+                    "status": "pending",
+                    "progress": 0.0,
+                    "error_message": None,
+                    "updated_at": datetime.utcnow(),
+                },
+                where=Download.status.in_(("failed", "deleted")),
+            )
+            .returning(Download)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        download = result.scalar_one_or_none()
+
+        if download is None:
+            # Queued concurrently and still active; return that record
+            result = await self.session.execute(
+                select(Download).where(Download.episode_id == values["episode_id"])
+            )
+            download = result.scalar_one()
+
+        return download
+
+    async def download_episode(self, download: Union[int, Download]) -> bool:
         """
         Download a single episode.
 
         Args:
-            download_id: Download record ID
+            download: Download record ID, or a Download record with its
+                episode and podcast already loaded (skips the lookup query)
 
         Returns:
             True if download succeeded, False otherwise
         """
-        async with self.download_semaphore:
+        if isinstance(download, int):
+            download_id = download
             # Get download with episode and podcast
             result = await self.session.execute(
                 select(Download)
@@ -170,41 +224,54 @@ class DownloadEngine:
                 logger.error(f"Download {download_id} not found")
                 return False
 
-            episode = download.episode
-            podcast = episode.podcast
+            if download.status != "pending":
+                # Cancelled, finished or picked up elsewhere since it was queued
+                logger.info(f"Skipping download {download_id} with status '{download.status}'")
+                return False
 
-            # Get full file path
-            full_path = self.file_manager.base_path / download.file_path
+        episode = download.episode
+        podcast = episode.podcast
 
-            logger.info(
-                f"Downloading [{podcast.title}] {episode.title} -> {full_path}"
-            )
+        # Get full file path
+        full_path = self.file_manager.base_path / download.file_path
 
-            # Perform the download
+        logger.info(
+            f"Downloading [{podcast.title}] {episode.title} -> {full_path}"
+        )
+
+        # Perform the download, bounded across all engines and workers
+        semaphore = _get_download_semaphore(get_settings().max_concurrent_downloads)
+        async with semaphore:
             success = await self.download_service.download_episode(
                 episode=episode,
                 file_path=full_path,
                 download_record=download,
-                session_factory=self._get_session,
+                session_factory=get_db_manager().async_session_maker,
             )
 
-            return success
+        if success:
+            # The finished file changed the free space
+            self.file_manager.invalidate_space_cache()
+
+        return success
 
     async def process_download_queue(self) -> int:
         """
         Process all pending downloads in the queue.
 
-        Downloads episodes concurrently up to max_concurrent limit.
+        Downloads episodes concurrently with a pool of max_concurrent workers.
 
         Returns:
             Number of episodes processed
         """
         logger.info("Processing download queue...")
 
-        # Get all pending downloads
+        # Get all pending downloads with their episode and podcast in one go,
+        # so the individual downloads don't each query them again
         result = await self.session.execute(
             select(Download)
-            .where(Download.status == "pending")
+            .options(selectinload(Download.episode).selectinload(Episode.podcast))
+            .where(ACTIVE_DOWNLOADS, Download.status == "pending")
             .order_by(Download.created_at)
         )
         pending = list(result.scalars().all())
@@ -215,14 +282,31 @@ class DownloadEngine:
 
         logger.info(f"Found {len(pending)} pending downloads")
 
-        # Create download tasks
-        tasks = [self.download_episode(d.id) for d in pending]
-
-        # Execute downloads concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Feed the downloads to a fixed pool of workers, so only max_concurrent
+        # downloads are ever in flight instead of one task per pending item
+        queue: asyncio.Queue = asyncio.Queue()
+        for download in pending:
+            queue.put_nowait(download)
+
+        results = []
+
+        async def worker() -> None:
+            while True:
+                try:
+                    download = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results.append(await self.download_episode(download))
+                except Exception as e:
+                    logger.error(f"Download {download.id} raised an error: {e}")
+                    results.append(e)
+
+        workers = min(self.max_concurrent, len(pending))
+        await asyncio.gather(*(worker() for _ in range(workers)))
 
         # Count successes
-        successful = sum(1 for r in results if r is True)
+        successful = results.count(True)
 
         logger.info(
             f"Download queue processed: {successful}/{len(pending)} successful"
@@ -239,34 +323,33 @@ class DownloadEngine:
         """
         logger.info("Retrying failed downloads...")
 
-        # Get failed downloads that can be retried
+        # Reset retryable failed downloads to pending in a single statement
         result = await self.session.execute(
-            select(Download)
+            update(Download)
             .where(Download.status == "failed")
             .where(Download.retry_count < self.max_retries)
-            .order_by(Download.updated_at)
+            .values(status="pending", progress=0.0, error_message=None)
+            .returning(Download.id)
+            .execution_options(synchronize_session=False)
         )
-        failed = list(result.scalars().all())
+        failed_ids = sorted(result.scalars().all())
+        await self.session.commit()
 
-        if not failed:
+        if not failed_ids:
             logger.info("No failed downloads to retry")
             return 0
 
-        logger.info(f"Found {len(failed)} failed downloads to retry")
-
-        # Reset to pending for retry
-        for download in failed:
-            download.status = "pending"
-            download.progress = 0.0
-            download.error_message = None
-            download.updated_at = datetime.utcnow()
+        logger.info(f"Reset {len(failed_ids)} failed downloads for retry")
 
-        await self.session.commit()
+        for download_id in failed_ids:
+            self.download_service.status_cache.invalidate(download_id)
 
-        # Process the retries
-        await self.process_download_queue()
+        # Hand the retries to the download worker, or process them here if
+        # no worker is running
+        if not _enqueue_downloads(failed_ids):
+            await self.process_download_queue()
 
-        return len(failed)
+        return len(failed_ids)
 
     async def cancel_download(self, download_id: int) -> bool:
         """
@@ -278,21 +361,22 @@ class DownloadEngine:
         Returns:
             True if cancelled, False if not found or already completed
         """
+        # Check and write in one statement, without loading the record
         result = await self.session.execute(
-            select(Download).where(Download.id == download_id)
+            update(Download)
+            .where(Download.id == download_id, Download.status != "completed")
+            .values(status="deleted")
+            .returning(Download.id),
+            execution_options={"synchronize_session": False},
         )
-        download = result.scalar_one_or_none()
-
-        if not download:
-            return False
+        cancelled = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if download.status == "completed":
-            logger.warning(f"Cannot cancel completed download: {download_id}")
+        if cancelled is None:
+            logger.warning(f"Cannot cancel download {download_id}: not found or completed")
             return False
 
-        download.status = "deleted"
-        download.updated_at = datetime.utcnow()
-        await self.session.commit()
+        self.download_service.status_cache.invalidate(download_id)
 
         logger.info(f"Cancelled download: {download_id}")
         return True
@@ -308,22 +392,25 @@ class DownloadEngine:
         Returns:
             True if deleted, False if not found
         """
+        # Delete the record and read back its file path in one statement
         result = await self.session.execute(
-            select(Download).where(Download.id == download_id)
+            delete(Download)
+            .where(Download.id == download_id)
+            .returning(Download.file_path),
+            execution_options={"synchronize_session": False},
         )
-        download = result.scalar_one_or_none()
+        row = result.one_or_none()
+        await self.session.commit()
 
-        if not download:
+        if row is None:
             return False
 
         # Delete file if requested and it exists
-        if delete_file and download.file_path:
-            full_path = self.file_manager.base_path / download.file_path
+        if delete_file and row.file_path:
+            full_path = self.file_manager.base_path / row.file_path
             self.file_manager.delete_file(full_path)
 
-        # Delete download record
-        await self.session.delete(download)
-        await self.session.commit()
+        self.download_service.status_cache.invalidate(download_id)
 
         logger.info(f"Deleted download: {download_id}")
         return True
@@ -338,10 +425,19 @@ class DownloadEngine:
         Returns:
             Download record or None if not found
         """
+        # Progress polls are served from the cache the download service keeps
+        # up to date while it writes the record
+        cached = self.download_service.status_cache.get(download_id)
+        if cached is not None:
+            return cached
+
         result = await self.session.execute(
             select(Download).where(Download.id == download_id)
         )
-        return result.scalar_one_or_none()
+        download = result.scalar_one_or_none()
+        if download is not None:
+            self.download_service.status_cache.put(download)
+        return download
 
     async def get_all_downloads(
         self, status: Optional[str] = None, skip: int = 0, limit: int = 100
@@ -367,11 +463,237 @@ class DownloadEngine:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
-    async def _get_session(self):
-        """Helper to get a new session for download service."""
-        # This is a simplified version - in practice, you'd want to use
-        # the database manager's session factory
-        from podcastmanager.db.database import get_db
+    async def stream_downloads(
+        self, status: Optional[str] = None, batch_size: int = 500
+    ) -> AsyncIterator[Download]:
+        """
+        Stream all downloads, optionally filtered by status.
+
+        Rows are fetched from a server-side cursor in batches, so memory stays
+        flat regardless of how many downloads exist.
 
-        async for session in get_db():
-            yield session
+        Args:
+            status: Filter by status (pending, downloading, completed, failed, deleted)
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Download records, newest first
+        """
+        query = select(Download).order_by(Download.created_at.desc())
+
+        if status:
+            query = query.where(Download.status == status)
+
+        result = await self.session.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        async for download in result:
+            yield download
+
+    async def get_downloads_page(
+        self, status: Optional[str] = None, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Download], int]:
+        """
+        Get a page of downloads together with the total number of matches.
+
+        The total is computed with a window function in the same query, so a
+        paginated listing costs a single round trip.
+
+        Args:
+            status: Filter by status (pending, downloading, completed, failed, deleted)
+            skip: Number to skip for pagination
+            limit: Maximum number to return
+
+        Returns:
+            Tuple of (download records, total matching downloads)
+        """
+        query = select(Download, func.count().over().label("total")).order_by(
+            Download.created_at.desc()
+        )
+
+        if status:
+            query = query.where(Download.status == status)
+
+        result = await self.session.execute(query.offset(skip).limit(limit))
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        if not skip:
+            return [], 0
+
+        # Page past the end: fall back to a plain count
+        count_query = select(func.count(Download.id))
+        if status:
+            count_query = count_query.where(Download.status == status)
+        count_result = await self.session.execute(count_query)
+        return [], count_result.scalar_one()
+
+
+class DownloadWorker:
+    """
+    Long-running service that performs queued downloads.
+
+    Downloads are pushed onto a persistent in-memory queue as soon as they are
+    queued, and a fixed pool of worker tasks picks them up immediately. The
+    periodic scheduler job only calls try_poll_once() as a safety net for
+    pending downloads that never made it onto the queue (e.g. after a restart).
+    """
+
+    def __init__(self, max_concurrent: int = 3):
+        """
+        Initialize the download worker.
+
+        Args:
+            max_concurrent: Number of downloads performed concurrently
+        """
+        self.max_concurrent = max_concurrent
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queued: Set[int] = set()
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker tasks are running."""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if self._workers:
+            logger.warning("Download worker already running")
+            return
+
+        self._workers = [
+            asyncio.create_task(self._run(), name=f"download-worker-{i}")
+            for i in range(self.max_concurrent)
+        ]
+        logger.info(f"Download worker started ({self.max_concurrent} concurrent downloads)")
+
+    async def stop(self) -> None:
+        """Stop the worker tasks, abandoning downloads still in the queue."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Download worker stopped")
+
+    def enqueue(self, download_id: int) -> bool:
+        """
+        Queue a download for immediate processing.
+
+        Args:
+            download_id: Download record ID
+
+        Returns:
+            True if queued, False if it was already queued
+        """
+        if download_id in self._queued:
+            return False
+        self._queued.add(download_id)
+        self._queue.put_nowait(download_id)
+        return True
+
+    async def try_poll_once(self) -> int:
+        """
+        Queue any pending downloads that are not already queued.
+
+        Returns:
+            Number of downloads newly queued
+        """
+        async with get_db_manager().async_session_maker() as session:
+            result = await session.execute(
+                select(Download.id)
+                .where(ACTIVE_DOWNLOADS, Download.status == "pending")
+                .order_by(Download.created_at)
+            )
+            pending_ids = list(result.scalars().all())
+
+        queued = sum(1 for download_id in pending_ids if self.enqueue(download_id))
+        if queued:
+            logger.info(f"Picked up {queued} pending downloads")
+        return queued
+
+    async def _run(self) -> None:
+        """Worker loop: perform queued downloads one at a time."""
+        while True:
+            download_id = await self._queue.get()
+            try:
+                async with get_db_manager().async_session_maker() as session:
+                    await DownloadEngine(session).download_episode(download_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Download {download_id} raised an error: {e}")
+            finally:
+                self._queued.discard(download_id)
+                self._queue.task_done()
+
+
+def _get_download_semaphore(limit: int) -> asyncio.Semaphore:
+    """
+    Get the process-wide download semaphore, creating it on first use.
+
+    Created lazily so it binds to the running event loop.
+
+    Args:
+        limit: Maximum concurrent downloads, used only on creation
+
+    Returns:
+        Shared semaphore
+    """
+    global _download_semaphore
+    if _download_semaphore is None:
+        _download_semaphore = asyncio.Semaphore(limit)
+    return _download_semaphore
+
+
+def _enqueue_downloads(download_ids: List[int]) -> bool:
+    """
+    Hand downloads to the download worker if it is running.
+
+    Args:
+        download_ids: Download record IDs
+
+    Returns:
+        True if a running worker accepted them, False otherwise
+    """
+    if _download_worker is None or not _download_worker.is_running:
+        return False
+    for download_id in download_ids:
+        _download_worker.enqueue(download_id)
+    return True
+
+
+# Global download worker instance
+_download_worker: Optional[DownloadWorker] = None
+
+
+def get_download_worker() -> DownloadWorker:
+    """
+    Get the global download worker instance.
+
+    Returns:
+        DownloadWorker instance
+
+    Raises:
+        RuntimeError: If the download worker hasn't been initialized
+    """
+    if _download_worker is None:
+        raise RuntimeError("Download worker not initialized")
+    return _download_worker
+
+
+def init_download_worker(max_concurrent: int = 3) -> DownloadWorker:
+    """
+    Initialize the global download worker.
+
+    Args:
+        max_concurrent: Number of downloads performed concurrently
+
+    Returns:
+        DownloadWorker instance
+    """
+    global _download_worker
+    _download_worker = DownloadWorker(max_concurrent=max_concurrent)
+    return _download_worker
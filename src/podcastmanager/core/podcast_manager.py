@@ -5,19 +5,27 @@ This module provides the business logic for managing podcasts and episodes,
 including adding podcasts, refreshing feeds, and discovering new episodes.
 """
 
+import heapq
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import httpx
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import delete, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from podcastmanager.core.rss_parser import get_rss_parser
+from podcastmanager.core.rss_parser import ParsedFeed, get_rss_parser
+from podcastmanager.db.database import dialect_insert
 from podcastmanager.db.models import Episode, Podcast
 from podcastmanager.utils.validators import sanitize_folder_name
 
 
+# Maximum number of GUIDs per existing-episode query, well under SQLite's
+# bound-parameter limit (999 before SQLite 3.32)
+GUID_LOOKUP_CHUNK_SIZE = 500
+
+
 class PodcastManager:
     """
     Service for managing podcasts and episodes.
@@ -29,14 +37,16 @@ class PodcastManager:
     - Managing podcast metadata
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize the podcast manager.
 
         Args:
             session: SQLAlchemy async session
+            http_client: HTTP client for feed fetches (defaults to the shared client)
         """
         self.session = session
+        self.http_client = http_client
         self.rss_parser = get_rss_parser()
 
     async def add_podcast_from_rss(
@@ -64,20 +74,19 @@ class PodcastManager:
         """
         logger.info(f"Adding podcast from RSS: {rss_url}")
 
-        # Check if podcast already exists
-        existing = await self.get_podcast_by_rss_url(rss_url)
-        if existing:
-            logger.warning(f"Podcast already exists: {existing.title}")
-            return existing
+        # Check if podcast already exists; only load it when it does
+        if await self._rss_exists(rss_url):
+            existing = await self.get_podcast_by_rss_url(rss_url)
+            if existing:
+                logger.warning(f"Podcast already exists: {existing.title}")
+                return existing
 
-        # Fetch and parse the feed
-        feed = await self.rss_parser.fetch_feed(rss_url)
-        if not feed:
+        # Fetch the feed and extract podcast metadata and episodes
+        parsed_feed = await self.rss_parser.fetch_feed(rss_url, client=self.http_client)
+        if not parsed_feed:
             logger.error(f"Failed to fetch RSS feed: {rss_url}")
             return None
-
-        # Extract podcast metadata
-        metadata = self.rss_parser.parse_podcast_metadata(feed, rss_url)
+        metadata, episode_data_list = parsed_feed
 
         # Create download path (sanitized folder name)
         download_path = sanitize_folder_name(metadata['title'])
@@ -105,17 +114,21 @@ class PodcastManager:
         logger.success(f"Created podcast: {podcast.title} (ID: {podcast.id})")
 
         # Discover and add episodes
-        await self._discover_episodes(podcast, feed)
+        await self._discover_episodes(podcast, episode_data_list)
 
         await self.session.commit()
         return podcast
 
-    async def refresh_podcast(self, podcast_id: int) -> bool:
+    async def refresh_podcast(
+        self, podcast_id: int, parsed_feed: Optional[ParsedFeed] = None
+    ) -> bool:
         """
         Refresh a podcast by fetching the latest feed and discovering new episodes.
 
         Args:
             podcast_id: ID of the podcast to refresh
+            parsed_feed: Already fetched (metadata, episodes) tuple (e.g. from
+                RSSParser.iter_feeds); fetched here if omitted
 
         Returns:
             True if successful, False otherwise
@@ -129,31 +142,42 @@ class PodcastManager:
             return False
 
         # Fetch the latest feed
-        feed = await self.rss_parser.fetch_feed(podcast.rss_url)
-        if not feed:
+        if parsed_feed is None:
+            parsed_feed = await self.rss_parser.fetch_feed(
+                podcast.rss_url, client=self.http_client
+            )
+        if not parsed_feed:
             logger.error(f"Failed to refresh podcast: {podcast.title}")
             return False
 
         # Update podcast metadata
-        metadata = self.rss_parser.parse_podcast_metadata(feed, podcast.rss_url)
-        podcast.title = metadata['title']
-        podcast.description = metadata['description']
-        podcast.author = metadata['author']
-        podcast.image_url = metadata['image_url']
-        podcast.website_url = metadata['website_url']
-        podcast.category = metadata['category']
-        podcast.language = metadata['language']
-        podcast.last_checked = datetime.utcnow()
+        metadata, episode_data_list = parsed_feed
+        # Write the metadata with one UPDATE; the loaded podcast is kept in
+        # sync in Python rather than going through dirty tracking
+        await self.session.execute(
+            update(Podcast)
+            .where(Podcast.id == podcast.id)
+            .values(
+                title=metadata['title'],
+                description=metadata['description'],
+                author=metadata['author'],
+                image_url=metadata['image_url'],
+                website_url=metadata['website_url'],
+                category=metadata['category'],
+                language=metadata['language'],
+                last_checked=datetime.utcnow(),
+            )
+        )
 
         # Discover new episodes
-        new_episodes_count = await self._discover_episodes(podcast, feed)
+        new_episodes_count = await self._discover_episodes(podcast, episode_data_list)
 
         await self.session.commit()
 
         logger.success(f"Refreshed podcast: {podcast.title}, found {new_episodes_count} new episodes")
         return True
 
-    async def _discover_episodes(self, podcast: Podcast, feed) -> int:
+    async def _discover_episodes(self, podcast: Podcast, episode_data_list: List[Dict]) -> int:
         """
         Discover and add episodes from a feed.
 
@@ -161,23 +185,27 @@ class PodcastManager:
 
         Args:
             podcast: Podcast object
-            feed: Parsed RSS feed
+            episode_data_list: Episodes parsed from the feed
 
         Returns:
             Number of new episodes added
         """
-        # Parse all episodes from feed
-        episode_data_list = self.rss_parser.parse_episodes(feed)
-
         if not episode_data_list:
             logger.info(f"No episodes found in feed for: {podcast.title}")
             return 0
 
-        # Get existing episode GUIDs for this podcast
-        result = await self.session.execute(
-            select(Episode.guid).where(Episode.podcast_id == podcast.id)
-        )
-        existing_guids = {row[0] for row in result.fetchall()}
+        # Look up only the feed's GUIDs that are already stored, rather than
+        # every GUID in the podcast's history
+        feed_guids = [ep['guid'] for ep in episode_data_list]
+        existing_guids = set()
+        for i in range(0, len(feed_guids), GUID_LOOKUP_CHUNK_SIZE):
+            result = await self.session.execute(
+                select(Episode.guid).where(
+                    Episode.podcast_id == podcast.id,
+                    Episode.guid.in_(feed_guids[i:i + GUID_LOOKUP_CHUNK_SIZE]),
+                )
+            )
+            existing_guids.update(result.scalars().all())
 
         # Filter out existing episodes
         new_episode_data = [
@@ -188,46 +216,46 @@ class PodcastManager:
             logger.info(f"No new episodes found for: {podcast.title}")
             return 0
 
-        # Limit to max_episodes_to_keep most recent episodes
-        # Sort by pub_date (newest first)
-        new_episode_data.sort(
+        # Limit to max_episodes_to_keep most recent episodes (newest first);
+        # a partial heap select avoids sorting the whole feed to keep a few
+        new_episode_data = heapq.nlargest(
+            podcast.max_episodes_to_keep,
+            new_episode_data,
             key=lambda x: x['pub_date'] or datetime.min,
-            reverse=True
         )
-        new_episode_data = new_episode_data[:podcast.max_episodes_to_keep]
-
-        # Create episode objects
-        added_count = 0
-        for episode_data in new_episode_data:
-            try:
-                # Use a savepoint (nested transaction) for each episode
-                # This allows us to rollback individual episodes without affecting others
-                async with self.session.begin_nested():
-                    episode = Episode(
-                        podcast_id=podcast.id,
-                        title=episode_data['title'],
-                        description=episode_data['description'],
-                        guid=episode_data['guid'],
-                        pub_date=episode_data['pub_date'],
-                        duration=episode_data['duration'],
-                        audio_url=episode_data['audio_url'],
-                        file_size=episode_data['file_size'],
-                        file_type=episode_data['file_type'],
-                        episode_number=episode_data['episode_number'],
-                        season_number=episode_data['season_number'],
-                    )
-                    self.session.add(episode)
-                    await self.session.flush()
-                added_count += 1
-            except Exception as e:
-                # If episode already exists (GUID conflict), skip it and continue
-                if "UNIQUE constraint failed" in str(e) or "IntegrityError" in str(type(e).__name__):
-                    logger.warning(f"Skipping duplicate episode (GUID: {episode_data['guid']}): {episode_data['title']}")
-                    # The nested transaction is automatically rolled back on exception
-                    continue
-                else:
-                    # Re-raise other errors
-                    raise
+        if not new_episode_data:
+            return 0
+
+        rows = [
+            {
+                "podcast_id": podcast.id,
+                "title": episode_data['title'],
+                "description": episode_data['description'],
+                "guid": episode_data['guid'],
+                "pub_date": episode_data['pub_date'],
+                "duration": episode_data['duration'],
+                "audio_url": episode_data['audio_url'],
+                "file_size": episode_data['file_size'],
+                "file_type": episode_data['file_type'],
+                "episode_number": episode_data['episode_number'],
+                "season_number": episode_data['season_number'],
+            }
+            for episode_data in new_episode_data
+        ]
+
+        # Insert all new episodes in one statement; episodes whose GUID this
+        # podcast already has (e.g. from a concurrent refresh) are skipped
+        stmt = dialect_insert(self.session, Episode)
+        if stmt is not None:
+            result = await self.session.execute(
+                stmt.on_conflict_do_nothing().returning(Episode.id), rows
+            )
+            added_count = len(result.all())
+        else:
+            # Bulk Core INSERT (batched by insertmanyvalues), skipping the
+            # unit of work
+            await self.session.execute(insert(Episode), rows)
+            added_count = len(rows)
 
         if added_count > 0:
             logger.success(f"Added {added_count} new episodes for: {podcast.title}")
@@ -245,10 +273,8 @@ class PodcastManager:
         Returns:
             Podcast object or None if not found
         """
-        result = await self.session.execute(
-            select(Podcast).where(Podcast.id == podcast_id)
-        )
-        return result.scalar_one_or_none()
+        # Served from the identity map without a query when already loaded
+        return await self.session.get(Podcast, podcast_id)
 
     async def get_podcast_by_rss_url(self, rss_url: str) -> Optional[Podcast]:
         """
@@ -265,6 +291,23 @@ class PodcastManager:
         )
         return result.scalar_one_or_none()
 
+    async def _rss_exists(self, rss_url: str) -> bool:
+        """
+        Check whether a podcast with the given RSS URL exists.
+
+        Answered from the unique rss_url index without loading the row.
+
+        Args:
+            rss_url: RSS feed URL
+
+        Returns:
+            True if a podcast with this URL exists
+        """
+        result = await self.session.scalar(
+            select(literal(1)).select_from(Podcast).where(Podcast.rss_url == rss_url).limit(1)
+        )
+        return result is not None
+
     async def get_all_podcasts(self, skip: int = 0, limit: int = 100) -> List[Podcast]:
         """
         Get all podcasts with pagination.
@@ -288,6 +331,10 @@ class PodcastManager:
         """
         Get a podcast with all its episodes loaded.
 
+        Episodes are eager loaded in one extra SELECT (newest first) so that
+        serializing them never triggers a lazy load. This loads every episode;
+        use get_podcast_by_id with get_podcast_episodes for a bounded page.
+
         Args:
             podcast_id: Podcast ID
 
@@ -337,17 +384,21 @@ class PodcastManager:
         Returns:
             True if deleted, False if not found
         """
-        podcast = await self.get_podcast_by_id(podcast_id)
-        if not podcast:
+        # Delete in one statement; episodes and downloads go with it through
+        # the ON DELETE CASCADE foreign keys
+        result = await self.session.execute(
+            delete(Podcast)
+            .where(Podcast.id == podcast_id)
+            .returning(Podcast.id, Podcast.title)
+        )
+        deleted = result.one_or_none()
+        if not deleted:
             logger.warning(f"Podcast not found for deletion: {podcast_id}")
             return False
 
-        logger.info(f"Deleting podcast: {podcast.title} (ID: {podcast_id})")
-
-        await self.session.delete(podcast)
         await self.session.commit()
 
-        logger.success(f"Deleted podcast: {podcast.title}")
+        logger.success(f"Deleted podcast: {deleted.title} (ID: {podcast_id})")
         return True
 
     async def update_podcast_settings(
@@ -367,19 +418,30 @@ class PodcastManager:
         Returns:
             Updated Podcast object or None if not found
         """
-        podcast = await self.get_podcast_by_id(podcast_id)
+        values = {"updated_at": datetime.utcnow()}
+        if max_episodes_to_keep is not None:
+            values["max_episodes_to_keep"] = max_episodes_to_keep
+        if auto_download is not None:
+            values["auto_download"] = auto_download
+
+        # Update and read back the row in one statement, without loading it first
+        result = await self.session.execute(
+            update(Podcast)
+            .where(Podcast.id == podcast_id)
+            .values(**values)
+            .returning(Podcast),
+            execution_options={"populate_existing": True},
+        )
+        podcast = result.scalar_one_or_none()
         if not podcast:
             return None
 
         if max_episodes_to_keep is not None:
-            podcast.max_episodes_to_keep = max_episodes_to_keep
             logger.info(f"Updated max episodes for {podcast.title}: {max_episodes_to_keep}")
 
         if auto_download is not None:
-            podcast.auto_download = auto_download
             logger.info(f"Updated auto-download for {podcast.title}: {auto_download}")
 
-        podcast.updated_at = datetime.utcnow()
         await self.session.commit()
 
         return podcast
@@ -5,16 +5,63 @@ This module handles parsing RSS/Atom feeds to extract podcast metadata
 and episode information.
 """
 
+import asyncio
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import feedparser
+import httpx
 from loguru import logger
 
 from podcastmanager.utils.validators import extract_file_extension
-from podcastmanager.utils.html_sanitizer import sanitize_html
+from podcastmanager.utils.html_sanitizer import sanitize_html, sanitize_html_many
+from podcastmanager.services.http_client import get_http_client
+
+
+FEED_USER_AGENT = "AppleCoreMedia/1.0.0.19H524 (iPhone; U; CPU OS 15_7 like Mac OS X; en_us)"
+
+# MIME top-level types accepted for episode enclosures
+_MEDIA_KINDS = frozenset({'audio', 'video'})
+
+# Request headers for unconditional feed fetches, built once
+FEED_REQUEST_HEADERS = httpx.Headers({"User-Agent": FEED_USER_AGENT})
+
+# Maximum number of feeds fetched at once by iter_feeds
+FEED_FETCH_CONCURRENCY = 16
+
+# Maximum number of feeds whose validators (ETag/Last-Modified), body digest
+# and extracted content are kept to short-circuit unchanged refreshes
+FEED_CACHE_MAX_ENTRIES = 512
+
+# Podcast metadata and episode dictionaries extracted from a feed
+ParsedFeed = Tuple[Dict, List[Dict]]
+
+
+class _CachedFeed:
+    """
+    Last fetched state of a feed URL.
+
+    Only the extracted metadata and episodes are kept, not the feedparser
+    result they came from, which holds every entry's raw fields as well.
+    """
+
+    __slots__ = ("etag", "last_modified", "digest", "parsed")
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        digest: bytes,
+        parsed: ParsedFeed,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.parsed = parsed
 
 
 class RSSParser:
@@ -32,26 +79,73 @@ class RSSParser:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
-
-    async def fetch_feed(self, rss_url: str) -> Optional[feedparser.FeedParserDict]:
+        # rss_url -> last fetched state, least recently used first
+        self._feed_cache: "OrderedDict[str, _CachedFeed]" = OrderedDict()
+
+    async def fetch_feed(
+        self,
+        rss_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Optional[ParsedFeed]:
         """
-        Fetch and parse an RSS feed from a URL.
+        Fetch an RSS feed and extract its podcast metadata and episodes.
+
+        A previously fetched feed is revalidated, and when it has not changed
+        the previous result is returned without parsing it again.
 
         Args:
             rss_url: URL of the RSS feed
+            client: HTTP client to fetch with (defaults to the shared client)
 
         Returns:
-            Parsed feed data or None if fetch failed
+            Tuple of (podcast metadata, list of episode dictionaries), or None
+            if the fetch failed
         """
         try:
             logger.info(f"Fetching RSS feed: {rss_url}")
 
-            # Let feedparser handle the fetching and parsing
-            # It handles encoding, redirects, and compression better than doing it manually
-            # Set user agent via feedparser
-            feed = feedparser.parse(
-                rss_url,
-                agent="AppleCoreMedia/1.0.0.19H524 (iPhone; U; CPU OS 15_7 like Mac OS X; en_us)"
+            # Fetch over the pooled client, then let feedparser handle
+            # encoding detection and parsing of the raw bytes
+            client = client or get_http_client()
+            headers = FEED_REQUEST_HEADERS
+
+            # Revalidate a previously fetched feed instead of downloading it again
+            cached = self._feed_cache.get(rss_url)
+            if cached and (cached.etag or cached.last_modified):
+                headers = headers.copy()
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+            response = await client.get(rss_url, headers=headers, timeout=self.timeout)
+
+            if response.status_code == 304 and cached:
+                logger.info(f"Feed not modified: {rss_url}")
+                self._feed_cache.move_to_end(rss_url)
+                return cached.parsed
+
+            response.raise_for_status()
+
+            # Servers without validators often resend identical bytes; skip
+            # the parse when the body matches the last one seen
+            digest = hashlib.blake2b(response.content, digest_size=16).digest()
+            if cached and cached.digest == digest:
+                logger.info(f"Feed unchanged: {rss_url}")
+                cached.etag = response.headers.get("etag")
+                cached.last_modified = response.headers.get("last-modified")
+                self._feed_cache.move_to_end(rss_url)
+                return cached.parsed
+
+            response_headers = dict(response.headers)
+            # httpx has already decoded the body
+            response_headers.pop('content-encoding', None)
+            # Resolve relative links against the final (post-redirect) URL
+            response_headers['content-location'] = str(response.url)
+            # Parsing is CPU-bound; keep it off the event loop so other
+            # fetches and requests make progress meanwhile
+            feed = await asyncio.to_thread(
+                feedparser.parse, response.content, response_headers=response_headers
             )
 
             if feed.bozo:
@@ -72,13 +166,103 @@ class RSSParser:
                     logger.error(f"Feed parsing failed completely")
                     return None
 
+            # Extraction sanitizes HTML, so it is kept off the event loop too
+            parsed = await asyncio.to_thread(self.parse_feed, feed, rss_url)
+            self._remember_feed(rss_url, response, digest, parsed)
+
             logger.success(f"Successfully fetched feed with {len(feed.entries)} entries")
-            return feed
+            return parsed
 
         except Exception as e:
             logger.error(f"Error fetching/parsing feed {rss_url}: {e}")
             return None
 
+    def _remember_feed(
+        self,
+        rss_url: str,
+        response: httpx.Response,
+        digest: bytes,
+        parsed: ParsedFeed,
+    ) -> None:
+        """
+        Store a feed's validators, body digest and extracted content.
+
+        Args:
+            rss_url: URL of the RSS feed
+            response: Response the feed was parsed from
+            digest: BLAKE2b digest of the response body
+            parsed: Metadata and episodes extracted from the feed
+        """
+        self._feed_cache[rss_url] = _CachedFeed(
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            digest=digest,
+            parsed=parsed,
+        )
+        self._feed_cache.move_to_end(rss_url)
+        while len(self._feed_cache) > FEED_CACHE_MAX_ENTRIES:
+            self._feed_cache.popitem(last=False)
+
+    async def iter_feeds(
+        self,
+        rss_urls: List[str],
+        client: Optional[httpx.AsyncClient] = None,
+        concurrency: int = FEED_FETCH_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[int, Optional[ParsedFeed]]]:
+        """
+        Fetch and extract several RSS feeds concurrently, yielding each as it arrives.
+
+        A new fetch starts only when a finished one has been handed to the
+        caller, so at most ``concurrency`` feeds are in flight or waiting to be
+        consumed at any time, however many URLs are given.
+
+        Args:
+            rss_urls: URLs of the RSS feeds
+            client: HTTP client to fetch with (defaults to the shared client)
+            concurrency: Maximum number of feeds fetched or held at once
+
+        Yields:
+            (index into rss_urls, (metadata, episodes) tuple or None if the
+            fetch failed), in completion order
+        """
+        remaining = iter(enumerate(rss_urls))
+        running: Dict[asyncio.Task, int] = {}
+
+        def start_next() -> None:
+            for index, rss_url in remaining:
+                running[asyncio.create_task(self.fetch_feed(rss_url, client=client))] = index
+                return
+
+        for _ in range(concurrency):
+            start_next()
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = running.pop(task)
+                    start_next()
+                    yield index, None if task.exception() else task.result()
+        finally:
+            # The caller stopped early: abandon the fetches still running
+            for task in running:
+                task.cancel()
+
+    def parse_feed(
+        self, feed: feedparser.FeedParserDict, rss_url: str
+    ) -> ParsedFeed:
+        """
+        Extract podcast metadata and episodes from a feed in one call.
+
+        Args:
+            feed: Parsed feed data
+            rss_url: Original RSS URL
+
+        Returns:
+            Tuple of (podcast metadata, list of episode dictionaries)
+        """
+        return self.parse_podcast_metadata(feed, rss_url), self.parse_episodes(feed)
+
     def parse_podcast_metadata(self, feed: feedparser.FeedParserDict, rss_url: str) -> Dict:
         """
         Extract podcast metadata from a feed.
@@ -146,9 +330,21 @@ class RSSParser:
         episodes = []
         entries = feed.entries[:limit] if limit else feed.entries
 
-        for entry in entries:
+        # Sanitize every description in one batch up front
+        descriptions = sanitize_html_many(
+            [entry.get('description') or entry.get('summary', '') for entry in entries]
+        )
+
+        durations = self._parse_durations_bulk(
+            [entry.get('itunes_duration') for entry in entries]
+        )
+        pub_dates = self._parse_pub_dates_bulk(entries)
+
+        for entry, description, duration, pub_date in zip(
+            entries, descriptions, durations, pub_dates
+        ):
             try:
-                episode = self._parse_single_episode(entry)
+                episode = self._parse_single_episode(entry, description, duration, pub_date)
                 if episode:
                     episodes.append(episode)
             except Exception as e:
@@ -158,12 +354,21 @@ class RSSParser:
         logger.info(f"Parsed {len(episodes)} episodes from feed")
         return episodes
 
-    def _parse_single_episode(self, entry: feedparser.FeedParserDict) -> Optional[Dict]:
+    def _parse_single_episode(
+        self,
+        entry: feedparser.FeedParserDict,
+        description: str,
+        duration: Optional[int] = None,
+        pub_date: Optional[datetime] = None,
+    ) -> Optional[Dict]:
         """
         Parse a single episode entry from the feed.
 
         Args:
             entry: Feed entry for a single episode
+            description: Entry description, already sanitized
+            duration: Episode duration in seconds, already parsed
+            pub_date: Publication date, already parsed
 
         Returns:
             Episode dictionary or None if parsing failed
@@ -177,32 +382,16 @@ class RSSParser:
             logger.warning(f"Episode '{title}' has no GUID, skipping")
             return None
 
-        # Extract description and sanitize HTML to prevent XSS
-        description = entry.get('description') or entry.get('summary', '')
-        description = sanitize_html(description) if description else ''
-
-        # Parse publication date
-        pub_date = None
-        if 'published_parsed' in entry and entry.published_parsed:
-            try:
-                pub_date = datetime(*entry.published_parsed[:6])
-            except Exception:
-                pass
-
-        if not pub_date and 'published' in entry:
-            try:
-                pub_date = parsedate_to_datetime(entry.published)
-            except Exception:
-                pass
-
         # Extract audio enclosure
         audio_url = None
         file_size = None
         file_type = None
 
-        for enclosure in entry.get('enclosures', []):
+        enclosures = entry.get('enclosures') or ()
+        for enclosure in enclosures:
             enc_type = enclosure.get('type', '')
-            if enc_type.startswith('audio/') or enc_type.startswith('video/'):
+            kind, slash, _ = enc_type.partition('/')
+            if slash and kind in _MEDIA_KINDS:
                 audio_url = enclosure.get('href') or enclosure.get('url')
                 file_size = enclosure.get('length')
                 file_type = enc_type
@@ -210,8 +399,9 @@ class RSSParser:
 
         # If no enclosure found, try links
         if not audio_url:
-            for link in entry.get('links', []):
-                if link.get('type', '').startswith('audio/'):
+            for link in entry.get('links') or ():
+                kind, slash, _ = link.get('type', '').partition('/')
+                if slash and kind == 'audio':
                     audio_url = link.get('href')
                     file_type = link.get('type')
                     break
@@ -220,23 +410,22 @@ class RSSParser:
             logger.warning(f"Episode '{title}' has no audio URL, skipping")
             return None
 
-        # Parse duration (iTunes extension)
-        duration = None
-        if hasattr(entry, 'itunes_duration'):
-            duration = self._parse_duration(entry.itunes_duration)
-
-        # Parse episode/season numbers (iTunes extension)
+        # Parse episode/season numbers (iTunes extension). Plain dict lookups:
+        # hasattr on a FeedParserDict raises and catches AttributeError for
+        # every missing key
         episode_number = None
         season_number = None
-        if hasattr(entry, 'itunes_episode'):
+        itunes_episode = entry.get('itunes_episode')
+        if itunes_episode:
             try:
-                episode_number = int(entry.itunes_episode)
+                episode_number = int(itunes_episode)
             except (ValueError, TypeError):
                 pass
 
-        if hasattr(entry, 'itunes_season'):
+        itunes_season = entry.get('itunes_season')
+        if itunes_season:
             try:
-                season_number = int(entry.itunes_season)
+                season_number = int(itunes_season)
             except (ValueError, TypeError):
                 pass
 
@@ -285,19 +474,62 @@ class RSSParser:
             if duration_str.isdigit():
                 return int(duration_str)
 
-            # Parse HH:MM:SS or MM:SS format
+            # Parse HH:MM:SS or MM:SS format, one base-60 digit per part
             parts = duration_str.split(':')
-            if len(parts) == 3:  # HH:MM:SS
-                hours, minutes, seconds = parts
-                return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-            elif len(parts) == 2:  # MM:SS
-                minutes, seconds = parts
-                return int(minutes) * 60 + int(seconds)
-            else:
+            if len(parts) not in (2, 3):
                 return None
+            total = 0
+            for part in parts:
+                total = total * 60 + int(part)
+            return total
         except (ValueError, AttributeError):
             return None
 
+    def _parse_pub_dates_bulk(self, entries: List[feedparser.FeedParserDict]) -> List[Optional[datetime]]:
+        """
+        Parse the publication dates of a whole feed in one pass.
+
+        feedparser has normally already parsed each date into a struct_time;
+        the raw date string is only parsed for the entries where it could not.
+
+        Args:
+            entries: Feed entries
+
+        Returns:
+            Publication dates, None where missing or unparseable
+        """
+        pub_dates: List[Optional[datetime]] = []
+        for entry in entries:
+            pub_date = None
+            parsed = entry.get('published_parsed')
+            if parsed:
+                try:
+                    pub_date = datetime(*parsed[:6])
+                except Exception:
+                    pass
+
+            if pub_date is None and 'published' in entry:
+                try:
+                    pub_date = parsedate_to_datetime(entry.published)
+                except Exception:
+                    pass
+
+            pub_dates.append(pub_date)
+        return pub_dates
+
+    def _parse_durations_bulk(self, duration_strs: List[Optional[str]]) -> List[Optional[int]]:
+        """
+        Parse the iTunes durations of a whole feed in one pass.
+
+        Args:
+            duration_strs: Duration strings, None where an entry has none
+
+        Returns:
+            Durations in seconds, None where missing or unparseable
+        """
+        parse = self._parse_duration
+        return [parse(d) if d else None for d in duration_strs]
+
 
 # Global parser instance
 _rss_parser: Optional[RSSParser] = None
@@ -5,14 +5,52 @@ This module handles the SQLAlchemy database engine, session factory,
 and provides dependency injection for FastAPI routes.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Type
 
+from sqlalchemy import event, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from podcastmanager.db.models import Base
 
 
+# Synchronous PostgreSQL URL schemes that are rewritten to use asyncpg
+_POSTGRES_SCHEMES = ("postgres://", "postgresql://", "postgresql+psycopg2://")
+
+# PRAGMAs applied to every new SQLite connection. WAL lets readers proceed
+# while a write is in progress, and synchronous=NORMAL is durable under WAL.
+# Foreign keys are enforced so ON DELETE CASCADE works for bulk deletes.
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "foreign_keys": "ON",
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,  # 256 MB
+    "cache_size": -64000,  # 64 MB
+}
+
+
+def normalize_database_url(database_url: str) -> str:
+    """
+    Normalize a database URL to use an async driver.
+
+    PostgreSQL URLs without an explicit driver (or with psycopg2) are
+    rewritten to use asyncpg, the fastest async PostgreSQL driver.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Database URL with an async driver
+    """
+    for scheme in _POSTGRES_SCHEMES:
+        if database_url.startswith(scheme):
+            return "postgresql+asyncpg://" + database_url[len(scheme):]
+    return database_url
+
+
 class DatabaseManager:
     """
     Manages database connections and sessions.
@@ -21,24 +59,71 @@ class DatabaseManager:
     throughout the application.
     """
 
-    def __init__(self, database_url: str, echo: bool = False):
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        pool_size: int = 20,
+        max_overflow: int = 40,
+        pool_timeout: int = 10,
+        pool_recycle: int = 1800,
+        sqlite_pragmas: Optional[Dict[str, Any]] = None,
+    ):
         """
         Initialize the database manager.
 
         Args:
             database_url: SQLAlchemy database URL (e.g., sqlite+aiosqlite:///./podcast_manager.db)
             echo: Whether to log SQL queries (useful for debugging)
+            pool_size: Number of pooled connections
+            max_overflow: Extra connections allowed beyond pool_size
+            pool_timeout: Seconds to wait for a connection from the pool
+            pool_recycle: Seconds after which pooled connections are recycled
+                (not applied to SQLite)
+            sqlite_pragmas: PRAGMAs run on each new SQLite connection
+                (defaults to SQLITE_PRAGMAS)
         """
+        database_url = normalize_database_url(database_url)
         self.database_url = database_url
         self.echo = echo
 
+        engine_kwargs: Dict[str, Any] = {"echo": echo}
+        is_sqlite = "sqlite" in database_url
+        if is_sqlite:
+            # Keep SQLite connections open between sessions rather than
+            # reopening the file and replaying PRAGMAs for every request.
+            # Under WAL readers run concurrently, but writers still serialize
+            # on the file lock however many connections are pooled
+            engine_kwargs.update(
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+            )
+        else:
+            engine_kwargs.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=True,
+            )
+            if database_url.startswith("postgresql+asyncpg://"):
+                # PostgreSQL's JIT only pays off for long analytical queries
+                engine_kwargs["connect_args"] = {"server_settings": {"jit": "off"}}
+
         # Create async engine
-        # For SQLite, we use NullPool to avoid connection pool issues
-        self.engine = create_async_engine(
-            database_url,
-            echo=echo,
-            poolclass=NullPool if "sqlite" in database_url else None,
-        )
+        self.engine = create_async_engine(database_url, **engine_kwargs)
+
+        if is_sqlite:
+            pragmas = SQLITE_PRAGMAS if sqlite_pragmas is None else sqlite_pragmas
+
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+                cursor.close()
 
         # Create session factory
         self.async_session_maker = async_sessionmaker(
@@ -111,19 +196,21 @@ def get_db_manager() -> DatabaseManager:
     return db_manager
 
 
-def init_db(database_url: str, echo: bool = False) -> DatabaseManager:
+def init_db(database_url: str, echo: bool = False, **pool_options: Any) -> DatabaseManager:
     """
     Initialize the global database manager.
 
     Args:
         database_url: SQLAlchemy database URL
         echo: Whether to log SQL queries
+        **pool_options: Connection settings passed to DatabaseManager
+            (pool_size, max_overflow, pool_timeout, pool_recycle, sqlite_pragmas)
 
     Returns:
         DatabaseManager: The initialized database manager
     """
     global db_manager
-    db_manager = DatabaseManager(database_url, echo)
+    db_manager = DatabaseManager(database_url, echo, **pool_options)
     return db_manager
 
 
@@ -136,3 +223,67 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async for session in get_db_manager().get_session():
         yield session
+
+
+def dialect_insert(session: AsyncSession, model: Type[Base]):
+    """
+    Build an INSERT with ON CONFLICT support for the session's database.
+
+    Args:
+        session: Database session
+        model: ORM model class to insert into
+
+    Returns:
+        Dialect-specific insert construct (supporting on_conflict_do_update and
+        on_conflict_do_nothing), or None if the dialect has no ON CONFLICT
+        clause and callers must fall back to a plain insert
+    """
+    dialect = session.bind.dialect.name
+    if dialect == "sqlite":
+        return sqlite_insert(model)
+    if dialect == "postgresql":
+        return postgresql_insert(model)
+    return None
+
+
+async def bulk_copy(
+    session: AsyncSession,
+    model: Type[Base],
+    rows: List[Dict[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Insert many rows as fast as the underlying driver allows.
+
+    On asyncpg this streams the rows with COPY; on other drivers it falls back
+    to a single executemany INSERT. COPY bypasses Python-side column defaults,
+    so callers must supply every non-nullable column explicitly.
+
+    Args:
+        session: Database session (the rows join its current transaction)
+        model: ORM model class whose table receives the rows
+        rows: Row dictionaries keyed by column name
+        columns: Columns to insert (defaults to the keys of the first row)
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    columns = list(columns or rows[0].keys())
+
+    connection = await session.connection()
+    if connection.dialect.driver == "asyncpg":
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            model.__tablename__,
+            records=[tuple(row[c] for c in columns) for row in rows],
+            columns=columns,
+        )
+    else:
+        await session.execute(
+            insert(model), [{c: row[c] for c in columns} for row in rows]
+        )
+
+    return len(rows)
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
     DateTime,
@@ -18,12 +19,27 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    func,
+    text,
 )
+from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
-class Base(DeclarativeBase):
-    """Base class for all database models."""
+class Base(AsyncAttrs, DeclarativeBase):
+    """
+    Base class for all database models.
+
+    Timestamps are set in Python with ``datetime.utcnow`` so they are naive
+    UTC with microseconds on every dialect, like the other timestamp columns
+    (SQLite's CURRENT_TIMESTAMP only has whole seconds, and PostgreSQL's
+    now() would be server-local). The ``server_default`` only covers rows
+    written outside the ORM and Core defaults, e.g. by COPY.
+
+    ``AsyncAttrs`` provides ``await obj.awaitable_attrs.<name>`` for loading
+    an expired or deferred attribute without a synchronous lazy load.
+    """
 
     pass
 
@@ -64,16 +80,28 @@ class Podcast(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        nullable=False,
     )
     last_checked: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
+    # Episodes can number in the thousands: loading them must be explicit
+    # (eager load or a paged query), and deletes rely on ON DELETE CASCADE
+    # rather than loading them
     episodes: Mapped[List["Episode"]] = relationship(
-        "Episode", back_populates="podcast", cascade="all, delete-orphan"
+        "Episode",
+        back_populates="podcast",
+        cascade="all, delete-orphan",
+        order_by="desc(Episode.pub_date)",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -88,6 +116,11 @@ class Episode(Base):
     """
 
     __tablename__ = "episodes"
+    __table_args__ = (
+        # Also serves the per-podcast GUID existence check made on every feed
+        # refresh, so it is answered from the index alone
+        UniqueConstraint("podcast_id", "guid", name="uq_episode_podcast_guid"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     podcast_id: Mapped[int] = mapped_column(
@@ -97,15 +130,16 @@ class Episode(Base):
     # Episode metadata
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    guid: Mapped[str] = mapped_column(String(500), unique=True, nullable=False, index=True)
+    # GUIDs are only unique within a feed (uq_episode_podcast_guid)
+    guid: Mapped[str] = mapped_column(String(500), nullable=False)
 
     # Publication info
     pub_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
-    duration: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # in seconds
+    duration: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)  # in seconds
 
     # Media file info
     audio_url: Mapped[str] = mapped_column(String(1000), nullable=False)
-    file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # in bytes
+    file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)  # in bytes
     file_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Episode numbering (optional, not all podcasts provide this)
@@ -114,21 +148,36 @@ class Episode(Base):
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False
     )
 
     # Relationships
-    podcast: Mapped["Podcast"] = relationship("Podcast", back_populates="episodes")
+    # Loaded explicitly (selectinload/joinedload) by the queries that need
+    # them; an implicit lazy load would be an N+1 and fails under asyncio anyway
+    podcast: Mapped["Podcast"] = relationship(
+        "Podcast", back_populates="episodes", lazy="raise"
+    )
     download: Mapped[Optional["Download"]] = relationship(
-        "Download", back_populates="episode", uselist=False, cascade="all, delete-orphan"
+        "Download",
+        back_populates="episode",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
         return f"<Episode(id={self.id}, title='{self.title}', podcast_id={self.podcast_id})>"
 
 
-# Composite index for efficient episode queries
-Index("idx_episodes_podcast_pub_date", Episode.podcast_id, Episode.pub_date.desc())
+# Composite index for efficient episode queries. On PostgreSQL it also carries
+# the columns of a lightweight episode listing, so those are index-only scans
+Index(
+    "idx_episodes_podcast_pub_date",
+    Episode.podcast_id,
+    Episode.pub_date.desc(),
+    postgresql_include=["id", "title", "audio_url"],
+)
 
 
 class Download(Base):
@@ -151,12 +200,11 @@ class Download(Base):
         String(20),
         CheckConstraint("status IN ('pending', 'downloading', 'completed', 'failed', 'deleted')"),
         nullable=False,
-        index=True,
     )
 
     # File information
     file_path: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
-    file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # actual downloaded size
+    file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)  # actual downloaded size
 
     # Progress tracking (0.0 to 1.0)
     progress: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
@@ -169,19 +217,41 @@ class Download(Base):
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        nullable=False,
     )
 
     # Relationships
-    episode: Mapped["Episode"] = relationship("Episode", back_populates="download")
+    episode: Mapped["Episode"] = relationship(
+        "Episode", back_populates="download", lazy="raise"
+    )
 
     def __repr__(self) -> str:
         return f"<Download(id={self.id}, episode_id={self.episode_id}, status='{self.status}')>"
 
 
+# Predicate of the partial index below. SQLite only uses a partial index when
+# the query repeats its WHERE term, so queue scans add ACTIVE_DOWNLOADS as well
+ACTIVE_DOWNLOADS = text("downloads.status IN ('pending', 'downloading')")
+
+# Serves the queue scans (status = 'pending' ORDER BY created_at) without a
+# separate sort. Partial, so it only holds the small active working set: the
+# completed rows that make up most of the table are never scanned by status
+Index(
+    "idx_downloads_active",
+    Download.status,
+    Download.created_at,
+    postgresql_where=text("status IN ('pending', 'downloading')"),
+    sqlite_where=text("status IN ('pending', 'downloading')"),
+)
+
+
 class Setting(Base):
     """
     Application-wide settings stored in the database.
@@ -198,10 +268,14 @@ class Setting(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        nullable=False,
     )
 
     def __repr__(self) -> str:
@@ -8,15 +8,20 @@ configures logging, and wires together all components.
 import click
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from loguru import logger
 from pathlib import Path
 
 from podcastmanager.config import get_settings
+from podcastmanager.core.download_engine import init_download_worker
 from podcastmanager.db.database import init_db, get_db_manager
+from podcastmanager.services.download_service import get_download_service
 from podcastmanager.services.file_manager import init_file_manager
+from podcastmanager.services.http_client import close_http_client, init_http_client
 from podcastmanager.tasks.worker import init_scheduler
+from podcastmanager.utils.html_sanitizer import init_sanitize_pool, shutdown_sanitize_pool
 from podcastmanager.utils.logging import setup_logging
 
 
@@ -33,7 +38,14 @@ async def lifespan(app: FastAPI):
 
     # Initialize database
     logger.info(f"Initializing database: {settings.database_url}")
-    db_manager = init_db(settings.database_url, echo=settings.debug)
+    db_manager = init_db(
+        settings.database_url,
+        echo=settings.debug,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
 
     # Create tables if they don't exist (for development)
     # In production, use Alembic migrations instead
@@ -45,6 +57,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"Initializing file manager: {settings.download_base_path}")
     init_file_manager(settings.download_base_path)
 
+    # Start the HTML sanitization worker processes
+    init_sanitize_pool()
+
+    # Initialize the shared HTTP client (pooled connections for feed fetches)
+    app.state.http = init_http_client()
+
+    # Start the download worker so queued downloads begin immediately
+    download_worker = init_download_worker(settings.max_concurrent_downloads)
+    download_worker.start()
+
     # Start background task scheduler
     logger.info("Starting background task scheduler")
     scheduler = init_scheduler()
@@ -61,6 +83,16 @@ async def lifespan(app: FastAPI):
     logger.info("Stopping background task scheduler")
     scheduler.stop()
 
+    # Stop the download worker
+    await download_worker.stop()
+
+    # Close pooled HTTP connections
+    await close_http_client()
+    await get_download_service().close()
+
+    # Stop HTML sanitization worker processes
+    shutdown_sanitize_pool()
+
     # Close database connections
     await db_manager.close()
     logger.info("Database connections closed")
@@ -87,6 +119,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         description="A modern podcast manager for Plex Media Server",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Mount static files
@@ -171,7 +204,7 @@ async def init_db_command():
     setup_logging(log_level=settings.log_level)
 
     logger.info("Initializing database...")
-    db_manager = init_db(settings.database_url, echo=True)
+    db_manager = init_db(settings.database_url, echo=settings.debug)
 
     try:
         await db_manager.create_tables()
@@ -197,7 +230,7 @@ async def reset_db(yes: bool):
         )
 
     logger.warning("Resetting database...")
-    db_manager = init_db(settings.database_url, echo=True)
+    db_manager = init_db(settings.database_url, echo=settings.debug)
 
     try:
         await db_manager.drop_tables()
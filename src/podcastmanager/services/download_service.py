@@ -5,17 +5,145 @@ This module handles the actual downloading of podcast audio files with
 progress tracking, resume support, and error handling.
 """
 
+import asyncio
+import base64
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import re
+import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
-import aiofiles
 import httpx
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from podcastmanager.db.models import Download, Episode
 
+# Seconds between batched progress writes
+PROGRESS_FLUSH_INTERVAL = 2.0
+
+# Downloaded bytes are buffered up to this size before each disk write
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# fallocate(2) mode that reserves blocks without changing the file size
+FALLOC_FL_KEEP_SIZE = 0x01
+
+# Units for _format_bytes; each is 1024 times the previous one
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Common signature parameters used by CDNs (matched case-sensitively)
+SIGNATURE_INDICATORS = (
+    'Signature=',
+    'Expires=',
+    'Key-Pair-Id=',
+    'Policy=',
+    'signature=',
+    'expires=',
+    'token=',
+    'auth=',
+    'hmac=',
+)
+
+# Common podcast tracking services that generate signed URLs after redirect
+# (matched case-insensitively)
+TRACKING_SERVICES = (
+    'podtrac.com',
+    'mgln.ai',
+    'chartable.com',
+    'podsights.com',
+    'podcorn.com',
+    'blubrry.com',
+    'feedpress.com',
+    'backtracks.fm',
+    'claritas.com',
+    'podscribe.com',
+    'spotify-analytics',
+    'art19.com',
+    'megaphone.fm',
+    'simplecast.com',
+)
+
+# Signature parameters only ever appear in the query string, while tracking
+# services show up in the host or, for redirect chains, in the path or the
+# query string (e.g. ?url=https://dts.podtrac.com/...)
+_SIGNATURE_RE = re.compile("|".join(map(re.escape, SIGNATURE_INDICATORS)))
+_TRACKING_RE = re.compile("|".join(map(re.escape, TRACKING_SERVICES)), re.IGNORECASE)
+
+
+class DownloadStatusCache:
+    """
+    Short-lived in-memory mirror of download records.
+
+    Progress polling reads the cached record instead of querying the database;
+    the download service refreshes an entry whenever it writes the record, and
+    entries older than the TTL fall back to the database.
+    """
+
+    # Number of entries above which expired entries are pruned on write
+    MAX_ENTRIES = 1024
+
+    def __init__(self, ttl: float = 1.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached record is considered fresh
+        """
+        self.ttl = ttl
+        self._entries: Dict[int, Tuple[Download, float]] = {}
+
+    def get(self, download_id: int) -> Optional[Download]:
+        """
+        Get a fresh cached download record.
+
+        Args:
+            download_id: Download record ID
+
+        Returns:
+            Cached Download or None if missing or stale
+        """
+        entry = self._entries.get(download_id)
+        if entry is None:
+            return None
+
+        download, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            self._entries.pop(download_id, None)
+            return None
+        return download
+
+    def put(self, download: Download) -> None:
+        """
+        Store a download record.
+
+        Args:
+            download: Download record with its attributes loaded
+        """
+        now = time.monotonic()
+        if len(self._entries) >= self.MAX_ENTRIES:
+            self._entries = {
+                key: entry for key, entry in self._entries.items()
+                if now - entry[1] <= self.ttl
+            }
+        self._entries[download.id] = (download, now)
+
+    def invalidate(self, download_id: int) -> None:
+        """
+        Drop a download record from the cache.
+
+        Args:
+            download_id: Download record ID
+        """
+        self._entries.pop(download_id, None)
+
 
 class DownloadService:
     """
@@ -29,16 +157,44 @@ class DownloadService:
     - Content validation
     """
 
-    def __init__(self, timeout: int = 3600, chunk_size: int = 8192):
+    def __init__(self, timeout: int = 3600, chunk_size: int = 262144):
         """
         Initialize the download service.
 
         Args:
             timeout: Download timeout in seconds (default: 1 hour)
-            chunk_size: Size of download chunks in bytes (default: 8KB)
+            chunk_size: Size of download chunks in bytes (default: 256KB)
         """
         self.timeout = timeout  # httpx uses plain timeout value
         self.chunk_size = chunk_size
+        self.status_cache = DownloadStatusCache()
+        # Latest progress per download, written in batches by the flusher
+        self._pending_progress: Dict[int, float] = {}
+        self._progress_session_factory = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client used for downloads, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: Long-lived client with pooled connections
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the download HTTP client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def download_episode(
         self,
@@ -54,11 +210,26 @@ class DownloadService:
             episode: Episode to download
             file_path: Destination file path
             download_record: Download database record to update
-            session_factory: Async callable that returns a database session
+            session_factory: Callable returning an async session context manager
+                (e.g. an async_sessionmaker)
 
         Returns:
             True if download succeeded, False otherwise
         """
+        # One session serves every status write of this download; it only
+        # holds a pooled connection while a write is in flight
+        self._progress_session_factory = session_factory
+        async with session_factory() as session:
+            return await self._download(episode, file_path, download_record, session)
+
+    async def _download(
+        self,
+        episode: Episode,
+        file_path: Path,
+        download_record: Download,
+        session: AsyncSession,
+    ) -> bool:
+        """Run a download, recording its state through the given session."""
         logger.info(f"Starting download: {episode.title} -> {file_path}")
 
         # Ensure parent directory exists
@@ -70,16 +241,11 @@ class DownloadService:
             resume_position = file_path.stat().st_size
             logger.info(f"Resuming download from byte {resume_position}")
 
-        # Only resolve URL if it's not a signed URL or tracking URL (they're sensitive to HEAD requests)
+        # Signed/tracking URLs get a podcast-app User-Agent. Redirects are
+        # followed by the GET itself, so no HEAD pre-flight is needed
         is_signed = self._is_signed_url(episode.audio_url)
         if is_signed:
-            logger.info(f"Detected signed/tracking URL, using directly without HEAD request")
-            final_url = episode.audio_url
-        else:
-            # Resolve final URL first (follow redirects)
-            final_url = await self._resolve_url(episode.audio_url)
-            if final_url != episode.audio_url:
-                logger.info(f"Resolved URL: {final_url}")
+            logger.info("Detected signed/tracking URL")
 
         try:
             # Create HTTP session with httpx (more reliable than aiohttp for redirects)
@@ -102,116 +268,142 @@ class DownloadService:
                 headers["Range"] = f"bytes={resume_position}-"
 
             logger.info(f"Using User-Agent: {headers['User-Agent'][:50]}...")
-            logger.info(f"Requesting URL: {final_url}")
+            logger.info(f"Requesting URL: {episode.audio_url}")
 
-            # Use httpx for downloads (handles redirects better than aiohttp)
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-            ) as client:
-                async with client.stream('GET', final_url, headers=headers) as response:
-                    logger.info(f"Got response status: {response.status_code}")
-                    logger.info(f"Final URL: {response.url}")
-
-                    # Check response status
-                    if response.status_code == 416:
-                        # Range not satisfiable - file already complete
-                        logger.info("File already complete")
-                        return await self._mark_complete(
-                            download_record, file_path, session_factory
-                        )
-
-                    if response.status_code not in (200, 206):
-                        error_msg = f"HTTP {response.status_code}: {response.reason_phrase}"
-                        logger.error(f"Download failed: {error_msg}")
-                        logger.error(f"Failed URL: {final_url}")
-                        logger.error(f"Original URL: {episode.audio_url}")
-                        # Log response headers for debugging
-                        logger.debug(f"Response headers: {dict(response.headers)}")
-                        await self._mark_failed(
-                            download_record, error_msg, session_factory
-                        )
-                        return False
+            # The client is shared across downloads, so episodes from the same
+            # CDN reuse its connections instead of a new TLS handshake each
+            client = self._get_client()
+            async with client.stream('GET', episode.audio_url, headers=headers) as response:
+                final_url = str(response.url)
+                logger.info(f"Got response status: {response.status_code}")
+                logger.info(f"Final URL: {final_url}")
 
-                    # Get total file size
-                    total_size = int(response.headers.get("content-length", 0))
-                    if response.status_code == 206:  # Partial content
-                        # Add resume position to get actual total
-                        total_size += resume_position
-
-                    # Get content type
-                    content_type = response.headers.get("content-type")
-
-                    # Update download status
-                    await self._update_status(
-                        download_record,
-                        status="downloading",
-                        started_at=datetime.utcnow(),
-                        session_factory=session_factory,
+                # Check response status
+                if response.status_code == 416:
+                    # Range not satisfiable - file already complete
+                    logger.info("File already complete")
+                    return await self._mark_complete(
+                        download_record, file_path, session
                     )
 
-                    # Download the file
-                    downloaded_bytes = resume_position
-                    mode = "ab" if resume_position > 0 else "wb"
-
-                    # Throttle progress updates (only update every 5% or 5MB)
-                    last_progress_update = 0
-                    progress_update_threshold = max(total_size * 0.05, 5 * 1024 * 1024)  # 5% or 5MB
-
-                    async with aiofiles.open(file_path, mode) as f:
-                        async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
-                            await f.write(chunk)
-                            downloaded_bytes += len(chunk)
-
-                            # Update progress only when threshold is reached
-                            if total_size > 0:
-                                bytes_since_update = downloaded_bytes - last_progress_update
-                                if bytes_since_update >= progress_update_threshold:
-                                    progress = downloaded_bytes / total_size
-                                    await self._update_progress(
-                                        download_record, progress, session_factory
-                                    )
-                                    last_progress_update = downloaded_bytes
-
-                    # Final progress update to ensure we reach 100%
-                    if total_size > 0 and downloaded_bytes > last_progress_update:
-                        await self._update_progress(
-                            download_record, downloaded_bytes / total_size, session_factory
-                        )
-
-                    # Verify file size
-                    actual_size = file_path.stat().st_size
-                    if total_size > 0 and actual_size != total_size:
-                        error_msg = (
-                            f"Size mismatch: expected {total_size}, got {actual_size}"
-                        )
-                        logger.warning(error_msg)
-                        # Don't fail if close enough (within 1%)
-                        if abs(actual_size - total_size) > (total_size * 0.01):
-                            await self._mark_failed(
-                                download_record, error_msg, session_factory
-                            )
-                            return False
-
-                    # Mark as complete
-                    logger.success(
-                        f"Download complete: {episode.title} ({self._format_bytes(actual_size)})"
+                if response.status_code not in (200, 206):
+                    error_msg = f"HTTP {response.status_code}: {response.reason_phrase}"
+                    logger.error(f"Download failed: {error_msg}")
+                    logger.error(f"Failed URL: {final_url}")
+                    logger.error(f"Original URL: {episode.audio_url}")
+                    # Log response headers for debugging
+                    logger.debug(f"Response headers: {dict(response.headers)}")
+                    await self._mark_failed(
+                        download_record, error_msg, session
                     )
-                    return await self._mark_complete(
-                        download_record, file_path, session_factory
+                    return False
+
+                # Get total file size
+                total_size = int(response.headers.get("content-length", 0))
+                if response.status_code == 206:  # Partial content
+                    # Add resume position to get actual total
+                    total_size += resume_position
+
+                # Get content type
+                content_type = response.headers.get("content-type")
+
+                # Update download status
+                await self._update_status(
+                    download_record,
+                    status="downloading",
+                    started_at=datetime.utcnow(),
+                    session=session,
+                )
+
+                # Download the file
+                downloaded_bytes = resume_position
+                flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                flags |= os.O_APPEND if resume_position > 0 else os.O_TRUNC
+
+                # Throttle progress updates (only update every 5% or 5MB)
+                last_progress_update = 0
+                progress_update_threshold = max(total_size * 0.05, 5 * 1024 * 1024)  # 5% or 5MB
+
+                # Checked against the body digest the server advertised, if any
+                expected_md5 = None
+                if response.status_code == 200:
+                    expected_md5 = _advertised_md5(response.headers)
+                digest = hashlib.md5() if expected_md5 else None
+
+                # Chunks are collected in memory and written a few MB at a
+                # time, so the thread pool is used once per buffer rather
+                # than once per chunk. The digest is updated in the same pass
+                fd = os.open(file_path, flags, 0o644)
+                if total_size > resume_position:
+                    _preallocate(fd, resume_position, total_size - resume_position)
+                buffer = bytearray()
+                try:
+                    async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                        buffer += chunk
+                        downloaded_bytes += len(chunk)
+                        if len(buffer) >= WRITE_BUFFER_SIZE:
+                            await asyncio.to_thread(_write_all, fd, buffer, digest)
+                            buffer.clear()
+
+                        # Update progress only when threshold is reached
+                        if total_size > 0:
+                            bytes_since_update = downloaded_bytes - last_progress_update
+                            if bytes_since_update >= progress_update_threshold:
+                                # Never wait on the database in the chunk loop
+                                self._queue_progress(
+                                    download_record.id,
+                                    downloaded_bytes / total_size,
+                                )
+                                last_progress_update = downloaded_bytes
+
+                    if buffer:
+                        await asyncio.to_thread(_write_all, fd, buffer, digest)
+                finally:
+                    os.close(fd)
+
+                # Verify content integrity
+                if digest is not None and digest.digest() != expected_md5:
+                    error_msg = "Checksum mismatch: body does not match Content-MD5"
+                    logger.warning(error_msg)
+                    # A retry must start over rather than resume corrupt bytes
+                    file_path.unlink(missing_ok=True)
+                    await self._mark_failed(download_record, error_msg, session)
+                    return False
+
+                # Verify file size
+                actual_size = file_path.stat().st_size
+                if total_size > 0 and actual_size != total_size:
+                    error_msg = (
+                        f"Size mismatch: expected {total_size}, got {actual_size}"
                     )
+                    logger.warning(error_msg)
+                    # Don't fail if close enough (within 1%)
+                    if abs(actual_size - total_size) > (total_size * 0.01):
+                        await self._mark_failed(
+                            download_record, error_msg, session
+                        )
+                        return False
+
+                # Mark as complete
+                logger.success(
+                    f"Download complete: {episode.title} ({self._format_bytes(actual_size)})"
+                )
+                return await self._mark_complete(
+                    download_record, file_path, session
+                )
 
         except httpx.HTTPError as e:
             error_msg = f"Network error: {str(e)}"
             logger.error(f"Download failed: {error_msg}")
-            await self._mark_failed(download_record, error_msg, session_factory)
+            await self._mark_failed(download_record, error_msg, session)
             return False
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
             logger.error(f"Download failed: {error_msg}")
-            await self._mark_failed(download_record, error_msg, session_factory)
+            # The error may have come from a write on this session
+            await session.rollback()
+            await self._mark_failed(download_record, error_msg, session)
             return False
 
     def _is_signed_url(self, url: str) -> bool:
@@ -219,6 +411,8 @@ class DownloadService:
         Check if URL appears to be a signed/time-limited URL or uses tracking redirects.
 
         Signed URLs and tracking redirects are sensitive to HEAD requests and should be used directly.
+        Signature parameters are only looked for in the query string; tracking
+        services anywhere in the host, path or query string.
 
         Args:
             url: URL to check
@@ -226,162 +420,248 @@ class DownloadService:
         Returns:
             True if URL appears to be signed or uses tracking
         """
-        # Common signature parameters used by CDNs
-        signature_indicators = [
-            'Signature=',
-            'Expires=',
-            'Key-Pair-Id=',
-            'Policy=',
-            'signature=',
-            'expires=',
-            'token=',
-            'auth=',
-            'hmac=',
-        ]
-
-        # Common podcast tracking services that generate signed URLs after redirect
-        tracking_services = [
-            'podtrac.com',
-            'mgln.ai',
-            'chartable.com',
-            'podsights.com',
-            'podcorn.com',
-            'blubrry.com',
-            'feedpress.com',
-            'backtracks.fm',
-            'claritas.com',
-            'podscribe.com',
-            'spotify-analytics',
-            'art19.com',
-            'megaphone.fm',
-            'simplecast.com',
-        ]
-
-        # Check for signature parameters
-        if any(indicator in url for indicator in signature_indicators):
-            return True
-
-        # Check for tracking services
-        if any(service in url.lower() for service in tracking_services):
-            return True
-
-        return False
-
-    async def _resolve_url(self, url: str) -> str:
-        """
-        Resolve URL by following redirects to get the final destination.
-
-        Args:
-            url: Original URL that may have redirects
-
-        Returns:
-            Final URL after following all redirects
-        """
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            }
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                # Use HEAD request to follow redirects without downloading content
-                response = await client.head(url, headers=headers)
-                final_url = str(response.url)
-                if final_url != url:
-                    logger.debug(f"URL redirected: {url} -> {final_url}")
-                return final_url
-        except Exception as e:
-            logger.warning(f"Could not resolve URL redirects: {e}, using original URL")
-            return url
+        parts = urlsplit(url)
+        return (
+            _host_is_tracking(parts.netloc)
+            or _SIGNATURE_RE.search(parts.query) is not None
+            or _TRACKING_RE.search(parts.path) is not None
+            or _TRACKING_RE.search(parts.query) is not None
+        )
 
     async def _update_status(
         self,
         download: Download,
         status: str,
         started_at: Optional[datetime] = None,
-        session_factory=None,
+        session: Optional[AsyncSession] = None,
     ):
         """Update download status in database."""
-        download_id = download.id
-        async for session in session_factory():
-            # Fetch the download fresh from the database
-            result = await session.execute(select(Download).where(Download.id == download_id))
-            db_download = result.scalar_one()
-
-            db_download.status = status
-            if started_at:
-                db_download.started_at = started_at
-            db_download.updated_at = datetime.utcnow()
-
-            await session.commit()
-            break
-
-    async def _update_progress(
-        self, download: Download, progress: float, session_factory
-    ):
-        """Update download progress in database."""
-        download_id = download.id
-        async for session in session_factory():
-            # Fetch the download fresh from the database
-            result = await session.execute(select(Download).where(Download.id == download_id))
-            db_download = result.scalar_one()
-
-            db_download.progress = min(1.0, max(0.0, progress))
-            db_download.updated_at = datetime.utcnow()
-
-            await session.commit()
-            break
+        values = {"status": status}
+        if started_at:
+            values["started_at"] = started_at
+        await self._write_download(download.id, session, **values)
 
     async def _mark_complete(
-        self, download: Download, file_path: Path, session_factory
+        self, download: Download, file_path: Path, session: AsyncSession
     ) -> bool:
         """Mark download as completed."""
         file_size = file_path.stat().st_size
-        download_id = download.id
-
-        async for session in session_factory():
-            # Fetch the download fresh from the database
-            from sqlalchemy import select
-            result = await session.execute(select(Download).where(Download.id == download_id))
-            db_download = result.scalar_one()
-
-            db_download.status = "completed"
-            db_download.progress = 1.0
-            db_download.file_size = file_size
-            db_download.completed_at = datetime.utcnow()
-            db_download.updated_at = datetime.utcnow()
-            db_download.error_message = None
-
-            await session.commit()
-            break
-
+        await self._write_download(
+            download.id,
+            session,
+            status="completed",
+            progress=1.0,
+            file_size=file_size,
+            completed_at=datetime.utcnow(),
+            error_message=None,
+        )
         return True
 
     async def _mark_failed(
-        self, download: Download, error_message: str, session_factory
+        self, download: Download, error_message: str, session: AsyncSession
     ) -> bool:
         """Mark download as failed."""
-        download_id = download.id
-        async for session in session_factory():
-            # Fetch the download fresh from the database
-            result = await session.execute(select(Download).where(Download.id == download_id))
-            db_download = result.scalar_one()
+        await self._write_download(
+            download.id,
+            session,
+            status="failed",
+            error_message=error_message,
+            retry_count=Download.retry_count + 1,
+        )
+        return False
 
-            db_download.status = "failed"
-            db_download.error_message = error_message
-            db_download.retry_count += 1
-            db_download.updated_at = datetime.utcnow()
+    def _queue_progress(self, download_id: int, progress: float) -> None:
+        """
+        Record download progress for the next batched write.
+
+        Only the latest value per download is kept, and the flusher task is
+        started on demand.
 
+        Args:
+            download_id: Download record ID
+            progress: Progress from 0.0 to 1.0
+        """
+        self._pending_progress[download_id] = min(1.0, max(0.0, progress))
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._progress_flusher())
+
+    async def _progress_flusher(self) -> None:
+        """Write queued progress in batches until no downloads report any."""
+        while self._pending_progress:
+            await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+            try:
+                await self.flush_progress()
+            except Exception as e:
+                logger.error(f"Failed to write download progress: {e}")
+
+    async def flush_progress(self) -> None:
+        """Write all queued progress values with one executemany UPDATE."""
+        if not self._pending_progress:
+            return
+
+        pending, self._pending_progress = self._pending_progress, {}
+        table = Download.__table__
+        # Only in-flight downloads take progress, so a late batch can never
+        # overwrite the final state written on completion or failure
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .where(table.c.status == "downloading")
+            .values(progress=bindparam("b_progress"))
+        )
+        async with self._progress_session_factory() as session:
+            await session.execute(
+                stmt,
+                [{"b_id": download_id, "b_progress": p} for download_id, p in pending.items()],
+            )
             await session.commit()
-            break
 
-        return False
+        for download_id in pending:
+            self.status_cache.invalidate(download_id)
+
+    async def _write_download(
+        self, download_id: int, session: AsyncSession, **values
+    ) -> None:
+        """
+        Update a download record with a single UPDATE ... RETURNING.
+
+        The returned row refreshes the status cache, so no SELECT is needed
+        before or after the write.
+
+        Args:
+            download_id: Download record ID
+            session: Session of the running download
+            **values: Column values to set
+        """
+        # A direct write supersedes any progress still waiting to be flushed
+        self._pending_progress.pop(download_id, None)
+
+        result = await session.execute(
+            update(Download)
+            .where(Download.id == download_id)
+            .values(**values)
+            .returning(Download),
+            execution_options={"populate_existing": True},
+        )
+        db_download = result.scalar_one()
+        await session.commit()
+        self.status_cache.put(db_download)
 
     def _format_bytes(self, bytes: int) -> str:
         """Format bytes in human-readable format."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if bytes < 1024.0:
-                return f"{bytes:.1f} {unit}"
-            bytes /= 1024.0
-        return f"{bytes:.1f} TB"
+        if bytes <= 0:
+            return "0.0 B"
+        # Each unit is 10 more bits, so the bit length picks it without a loop
+        i = min((bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes / (1 << (i * 10)):.1f} {_BYTE_UNITS[i]}"
+
+
+@lru_cache(maxsize=4096)
+def _host_is_tracking(netloc: str) -> bool:
+    """
+    Check whether a URL host belongs to a tracking service.
+
+    A feed serves all its episodes from a handful of hosts, so the result is
+    cached per host.
+
+    Args:
+        netloc: Host (and port) part of a URL
+
+    Returns:
+        True if the host matches a known tracking service
+    """
+    return _TRACKING_RE.search(netloc) is not None
+
+
+def _advertised_md5(headers: httpx.Headers) -> Optional[bytes]:
+    """
+    Get the MD5 digest a server advertised for a response body.
+
+    Reads Content-MD5, or the md5 entry of Google Cloud Storage's
+    x-goog-hash. Encoded bodies are skipped, since the digest covers the
+    encoded bytes rather than the decoded ones that are written to disk.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Raw 16-byte MD5 digest, or None if none was advertised
+    """
+    if headers.get("content-encoding", "identity") != "identity":
+        return None
+
+    values = [headers.get("content-md5", "")]
+    values += [
+        part.strip()[4:]
+        for part in headers.get("x-goog-hash", "").split(",")
+        if part.strip().startswith("md5=")
+    ]
+    for value in values:
+        try:
+            digest = base64.b64decode(value.strip(), validate=True)
+        except ValueError:
+            continue
+        if len(digest) == 16:
+            return digest
+    return None
+
+
+def _load_fallocate():
+    """
+    Look up fallocate(2) in the C library.
+
+    Returns:
+        The C function, or None where it is unavailable (non-Linux systems)
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fallocate = libc.fallocate
+    except (OSError, AttributeError):
+        return None
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong]
+    fallocate.restype = ctypes.c_int
+    return fallocate
+
+
+_fallocate = _load_fallocate()
+
+
+def _preallocate(fd: int, offset: int, length: int) -> None:
+    """
+    Reserve disk space for the rest of a download in one call.
+
+    Uses fallocate(2) with FALLOC_FL_KEEP_SIZE, so the filesystem can allocate
+    contiguous extents up front while the file size (used for resuming and
+    size checks) still only grows as bytes are written. Best effort: where it
+    is unsupported this does nothing.
+
+    Args:
+        fd: Open file descriptor
+        offset: Byte offset the reservation starts at
+        length: Number of bytes to reserve
+    """
+    if _fallocate is not None:
+        # Failure (e.g. a filesystem without fallocate) is harmless
+        _fallocate(fd, FALLOC_FL_KEEP_SIZE, offset, length)
+
+
+def _write_all(fd: int, data: bytearray, digest=None) -> None:
+    """
+    Write all of a buffer to a file descriptor.
+
+    Args:
+        fd: Open file descriptor
+        data: Bytes to write
+        digest: Optional hashlib object to update with the bytes
+    """
+    if digest is not None:
+        digest.update(data)
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
 
 
 # Global download service instance
@@ -5,9 +5,14 @@ This module handles file system operations for podcast downloads including
 creating directories, generating file paths, and managing storage.
 """
 
+import os
+import shutil
+import stat
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
@@ -19,6 +24,13 @@ from podcastmanager.utils.validators import (
     validate_download_path,
 )
 
+# Units for format_file_size; each is 1024 times the previous one
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# How long a free-space reading stays valid; free space changes slowly, while
+# enqueue bursts check it once per episode
+SPACE_CACHE_TTL = 1.0
+
 
 class FileManager:
     """
@@ -31,15 +43,23 @@ class FileManager:
     - Disk space checking
     """
 
-    def __init__(self, base_download_path: Path):
+    def __init__(self, base_download_path: Path, space_cache_ttl: float = SPACE_CACHE_TTL):
         """
         Initialize the file manager.
 
         Args:
             base_download_path: Base directory for all podcast downloads
+            space_cache_ttl: Seconds a free-space reading is reused for
         """
         self.base_path = Path(base_download_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Passed to the free-space syscall, which takes a plain string
+        self._base_path_str = os.fspath(self.base_path)
+        self.space_cache_ttl = space_cache_ttl
+        # (timestamp, available bytes) of the last free-space reading
+        self._space_cache: Optional[Tuple[float, int]] = None
+        # Podcast directories already created by this process, by folder name
+        self._podcast_dirs: Dict[str, Path] = {}
         logger.info(f"File manager initialized with base path: {self.base_path}")
 
     def get_podcast_directory(self, podcast: Podcast) -> Path:
@@ -56,11 +76,30 @@ class FileManager:
         # or sanitize the title if download_path is not set
         folder_name = podcast.download_path or sanitize_folder_name(podcast.title)
 
-        podcast_dir = self.base_path / folder_name
-        podcast_dir.mkdir(parents=True, exist_ok=True)
+        # Only the first request for a directory builds its path and touches
+        # the filesystem. Keyed by folder name, so a renamed podcast simply
+        # resolves to its new folder
+        podcast_dir = self._podcast_dirs.get(folder_name)
+        if podcast_dir is None:
+            podcast_dir = self.base_path / folder_name
+            podcast_dir.mkdir(parents=True, exist_ok=True)
+            self._podcast_dirs[folder_name] = podcast_dir
 
         return podcast_dir
 
+    def forget_dir(self, path: Path) -> None:
+        """
+        Drop a directory from the created-directory cache after removing it.
+
+        Args:
+            path: Podcast directory that no longer exists
+        """
+        self._podcast_dirs = {
+            name: podcast_dir
+            for name, podcast_dir in self._podcast_dirs.items()
+            if podcast_dir != path
+        }
+
     def generate_episode_filename(
         self,
         episode: Episode,
@@ -154,13 +193,33 @@ class FileManager:
         """
         Get available disk space in bytes.
 
+        The filesystem is queried at most once per space_cache_ttl.
+
         Returns:
-            Available space in bytes
+            Available space in bytes, minus space reserved since the last reading
+        """
+        now = time.monotonic()
+        if self._space_cache is None or now - self._space_cache[0] > self.space_cache_ttl:
+            self._space_cache = (now, _free_bytes(self._base_path_str))
+        return self._space_cache[1]
+
+    def reserve_space(self, size: int) -> None:
         """
-        import shutil
+        Subtract a queued episode's size from the cached free space.
 
-        stats = shutil.disk_usage(self.base_path)
-        return stats.free
+        Keeps a burst of enqueues from all believing they fit in the same
+        free space until the next real reading.
+
+        Args:
+            size: Expected file size in bytes
+        """
+        if self._space_cache is not None:
+            timestamp, available = self._space_cache
+            self._space_cache = (timestamp, max(available - size, 0))
+
+    def invalidate_space_cache(self) -> None:
+        """Force the next free-space check to query the filesystem."""
+        self._space_cache = None
 
     def has_enough_space(self, required_bytes: int, buffer_gb: float = 1.0) -> bool:
         """
@@ -189,13 +248,15 @@ class FileManager:
         Returns:
             File size in bytes or None if file doesn't exist
         """
+        # One stat call answers existence, type and size together
         try:
-            if path.exists() and path.is_file():
-                return path.stat().st_size
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return None
         except Exception as e:
             logger.error(f"Error getting file size for {path}: {e}")
             return None
+        return st.st_size if stat.S_ISREG(st.st_mode) else None
 
     def delete_file(self, path: Path) -> bool:
         """
@@ -207,16 +268,78 @@ class FileManager:
         Returns:
             True if deleted successfully, False otherwise
         """
+        # unlink itself reports a missing path or a directory, so no stat
+        # calls are needed beforehand
         try:
-            if path.exists() and path.is_file():
-                path.unlink()
-                logger.info(f"Deleted file: {path}")
-                return True
+            path.unlink()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
             return False
         except Exception as e:
             logger.error(f"Error deleting file {path}: {e}")
             return False
 
+        self.invalidate_space_cache()
+        logger.info(f"Deleted file: {path}")
+        return True
+
+    def delete_files(self, paths: Iterable[Path]) -> Tuple[int, int]:
+        """
+        Delete many files, reporting how many went and the space they held.
+
+        Files are grouped by directory and each directory is opened once;
+        the files are then stat'ed and unlinked by name relative to it, so
+        the kernel resolves each parent path once per directory rather than
+        twice per file. Missing paths and non-files are skipped.
+
+        Args:
+            paths: File paths to delete
+
+        Returns:
+            Tuple of (files deleted, bytes freed)
+        """
+        by_parent: Dict[Path, List[str]] = {}
+        for path in paths:
+            by_parent.setdefault(path.parent, []).append(path.name)
+
+        use_dir_fd = os.unlink in os.supports_dir_fd and os.stat in os.supports_dir_fd
+        deleted = 0
+        freed = 0
+
+        for parent, names in by_parent.items():
+            dir_fd = None
+            if use_dir_fd:
+                try:
+                    dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    logger.error(f"Error opening directory {parent}: {e}")
+                    continue
+
+            try:
+                for name in names:
+                    target = name if dir_fd is not None else os.path.join(parent, name)
+                    try:
+                        st = os.stat(target, dir_fd=dir_fd)
+                        if not stat.S_ISREG(st.st_mode):
+                            continue
+                        os.unlink(target, dir_fd=dir_fd)
+                    except FileNotFoundError:
+                        continue
+                    except OSError as e:
+                        logger.error(f"Error deleting file {parent / name}: {e}")
+                        continue
+                    deleted += 1
+                    freed += st.st_size
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+        if deleted:
+            self.invalidate_space_cache()
+            logger.info(f"Deleted {deleted} files ({self.format_file_size(freed)})")
+        return deleted, freed
+
     def cleanup_empty_directories(self):
         """
         Remove empty podcast directories.
@@ -224,12 +347,19 @@ class FileManager:
         Useful after deleting episodes or podcasts.
         """
         try:
-            for podcast_dir in self.base_path.iterdir():
-                if podcast_dir.is_dir():
-                    # Check if directory is empty
-                    if not any(podcast_dir.iterdir()):
-                        podcast_dir.rmdir()
-                        logger.info(f"Removed empty directory: {podcast_dir}")
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    # rmdir refuses a non-empty directory, so it doubles as
+                    # the emptiness check
+                    try:
+                        os.rmdir(entry.path)
+                    except OSError:
+                        continue
+                    podcast_dir = Path(entry.path)
+                    self.forget_dir(podcast_dir)
+                    logger.info(f"Removed empty directory: {podcast_dir}")
         except Exception as e:
             logger.error(f"Error during directory cleanup: {e}")
 
@@ -247,15 +377,15 @@ class FileManager:
         total_size = 0
 
         try:
-            for file_path in podcast_dir.rglob("*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
+            total_size = sum(_iter_file_sizes(podcast_dir))
         except Exception as e:
             logger.error(f"Error calculating storage for {podcast.title}: {e}")
 
         return total_size
 
-    def format_file_size(self, bytes: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_file_size(bytes: int) -> str:
         """
         Format file size in human-readable format.
 
@@ -265,11 +395,54 @@ class FileManager:
         Returns:
             Formatted string (e.g., "45.2 MB")
         """
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes < 1024.0:
-                return f"{bytes:.1f} {unit}"
-            bytes /= 1024.0
-        return f"{bytes:.1f} PB"
+        if bytes <= 0:
+            return "0.0 B"
+        # Each unit is 10 more bits, so the bit length picks it without a loop
+        i = min((bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
+
+
+def _free_bytes(path: str) -> int:
+    """
+    Get the space available to unprivileged users on a path's filesystem.
+
+    Calls os.statvfs directly where it exists, skipping shutil.disk_usage's
+    wrapper; Windows has no statvfs and goes through shutil.
+
+    Args:
+        path: Path on the filesystem to check
+
+    Returns:
+        Available space in bytes
+    """
+    if hasattr(os, "statvfs"):
+        st = os.statvfs(path)
+        return st.f_bavail * st.f_frsize
+    return shutil.disk_usage(path).free
+
+
+def _iter_file_sizes(path: Path) -> Iterator[int]:
+    """
+    Yield the size of every regular file below a directory.
+
+    Walks with os.scandir, whose entries carry their file type (and on Windows
+    their stat), instead of building a Path and calling stat() per file.
+    Symlinks are not followed.
+
+    Args:
+        path: Directory to walk
+
+    Yields:
+        File sizes in bytes
+    """
+    stack = [os.fspath(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
 
 
 # Global file manager instance
@@ -0,0 +1,58 @@
+"""
+Shared HTTP client.
+
+This module owns a single process-wide httpx.AsyncClient so that feed fetches
+and other outbound requests reuse pooled connections (and HTTP/2 where the
+server supports it) instead of paying a TCP + TLS handshake per request.
+"""
+
+from typing import Optional
+
+import httpx
+from loguru import logger
+
+from podcastmanager.config import get_settings
+
+
+# Global HTTP client instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """
+    Initialize the global HTTP client.
+
+    Returns:
+        httpx.AsyncClient: Shared HTTP client
+    """
+    global _http_client
+    settings = get_settings()
+    _http_client = httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=settings.feed_request_timeout,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    )
+    logger.info("HTTP client initialized")
+    return _http_client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the global HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Shared HTTP client
+    """
+    if _http_client is None or _http_client.is_closed:
+        return init_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the global HTTP client and release its connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("HTTP client closed")
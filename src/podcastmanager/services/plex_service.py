@@ -5,8 +5,9 @@ This module provides functionality to interact with Plex Media Server,
 allowing the podcast manager to check play status and make smart cleanup decisions.
 """
 
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from loguru import logger
 
@@ -19,6 +20,14 @@ except ImportError:
     logger.warning("PlexAPI not installed. Plex integration disabled. Install with: pip install PlexAPI")
 
 
+# Seconds a Plex lookup is reused; long enough to cover a played check and a
+# progress query for the same file, short enough not to hide new plays
+LOOKUP_CACHE_TTL = 5.0
+
+# Entries kept before expired lookups are pruned
+LOOKUP_CACHE_MAX_ENTRIES = 1024
+
+
 class PlexService:
     """
     Service for interacting with Plex Media Server.
@@ -47,6 +56,8 @@ class PlexService:
         self.url = url
         self.token = token
         self.library_name = library_name
+        # file path -> (timestamp, matching Plex item or None)
+        self._lookup_cache: Dict[str, Tuple[float, Any]] = {}
 
         try:
             logger.info(f"Connecting to Plex server: {url}")
@@ -78,24 +89,14 @@ class PlexService:
             # Convert to Path for better handling
             path = Path(file_path)
 
-            # Try searching by filename first (faster)
             filename = path.name
             logger.debug(f"Searching Plex for: {filename}")
 
-            # Search in the library
-            results = self.library.search(title=path.stem)
-
-            if not results:
-                # Try searching by full path
-                results = self.library.searchFiles(file=str(path))
-
-            if not results:
+            episode = self._lookup(path)
+            if episode is None:
                 logger.debug(f"Episode not found in Plex: {filename}")
                 return False
 
-            # Check the first match
-            episode = results[0]
-
             # Check if it's been played
             # isPlayed is set when an item has been watched/listened to completion
             # viewCount tracks how many times it's been played
@@ -130,18 +131,10 @@ class PlexService:
             Progress as percentage (0.0 to 1.0), or None if not found
         """
         try:
-            path = Path(file_path)
-            filename = path.name
-
-            results = self.library.search(title=path.stem)
-            if not results:
-                results = self.library.searchFiles(file=str(path))
-
-            if not results:
+            episode = self._lookup(Path(file_path))
+            if episode is None:
                 return None
 
-            episode = results[0]
-
             # Get view offset (position in milliseconds)
             if hasattr(episode, 'viewOffset') and hasattr(episode, 'duration'):
                 if episode.duration and episode.duration > 0:
@@ -154,6 +147,42 @@ class PlexService:
             logger.error(f"Error getting episode progress for {file_path}: {e}")
             return None
 
+    def _lookup(self, path: Path) -> Any:
+        """
+        Find the Plex item for an episode file, reusing recent lookups.
+
+        Searches by title (the file stem) first, then by file path. Results,
+        including misses, are cached for LOOKUP_CACHE_TTL seconds so checks
+        made back to back for one file cost a single round-trip.
+
+        Args:
+            path: Path to the episode file
+
+        Returns:
+            First matching Plex item, or None if not found
+
+        Raises:
+            PlexApiException: If the Plex API request fails (not cached)
+        """
+        key = str(path)
+        now = time.monotonic()
+        cached = self._lookup_cache.get(key)
+        if cached is not None and now - cached[0] <= LOOKUP_CACHE_TTL:
+            return cached[1]
+
+        # Try searching by filename first (faster), then by full path
+        results = self.library.search(title=path.stem)
+        if not results:
+            results = self.library.searchFiles(file=key)
+        episode = results[0] if results else None
+
+        if len(self._lookup_cache) >= LOOKUP_CACHE_MAX_ENTRIES:
+            self._lookup_cache = {
+                k: v for k, v in self._lookup_cache.items() if now - v[0] <= LOOKUP_CACHE_TTL
+            }
+        self._lookup_cache[key] = (now, episode)
+        return episode
+
     def test_connection(self) -> bool:
         """
         Test the connection to Plex server.
@@ -181,8 +210,10 @@ class PlexService:
             Dictionary with library stats
         """
         try:
-            total_episodes = len(self.library.all())
-            played_count = len([e for e in self.library.all() if e.isPlayed])
+            # Fetch the library once and count played items in the same pass
+            items = self.library.all()
+            total_episodes = len(items)
+            played_count = sum(1 for e in items if e.isPlayed)
 
             stats = {
                 "library_name": self.library.title,
@@ -11,12 +11,13 @@ from loguru import logger
 from sqlalchemy import select
 
 from podcastmanager.config import get_settings
-from podcastmanager.core.download_engine import DownloadEngine
+from podcastmanager.core.download_engine import DownloadEngine, get_download_worker
 from podcastmanager.core.exceptions import (
     EpisodeNotFoundException,
     InsufficientStorageException,
 )
 from podcastmanager.core.podcast_manager import PodcastManager
+from podcastmanager.core.rss_parser import get_rss_parser
 from podcastmanager.db.database import get_db_manager
 from podcastmanager.db.models import Download, Episode, Podcast
 from podcastmanager.services.file_manager import get_file_manager
@@ -50,15 +51,25 @@ async def refresh_all_podcasts_job():
             refreshed = 0
             new_episodes_total = 0
 
-            for podcast in podcasts:
+            # Feeds are fetched concurrently and each is written as soon as it
+            # arrives, so only a few are held in memory at once; the database
+            # work shares one session and so stays sequential
+            feeds = get_rss_parser().iter_feeds([podcast.rss_url for podcast in podcasts])
+
+            async for index, feed in feeds:
+                podcast = podcasts[index]
                 try:
                     logger.debug(f"Refreshing: {podcast.title}")
 
+                    if not feed:
+                        logger.error(f"Failed to refresh podcast: {podcast.title}")
+                        continue
+
                     # Create podcast manager for this session
                     podcast_manager = PodcastManager(session)
 
                     # Refresh the podcast
-                    success = await podcast_manager.refresh_podcast(podcast.id)
+                    success = await podcast_manager.refresh_podcast(podcast.id, parsed_feed=feed)
 
                     if success:
                         refreshed += 1
@@ -131,37 +142,38 @@ async def refresh_all_podcasts_job():
 
 async def process_download_queue_job():
     """
-    Background job to process pending downloads.
+    Background job to pick up pending downloads.
 
-    This job:
-    1. Finds all pending downloads
-    2. Downloads episodes up to the concurrent limit
-    3. Updates download status
+    Downloads normally start as soon as they are queued, via the download
+    worker. This job is a safety net that:
+    1. Finds pending downloads the worker doesn't know about (e.g. after a restart)
+    2. Hands them to the download worker
+    3. Falls back to processing the queue directly if no worker is running
     """
     logger.info("=== Starting download queue processor ===")
 
     try:
-        db_manager = get_db_manager()
-        async for session in db_manager.get_session():
-            # Check for pending downloads
-            result = await session.execute(
-                select(Download).where(Download.status == "pending")
-            )
-            pending = list(result.scalars().all())
+        try:
+            download_worker = get_download_worker()
+        except RuntimeError:
+            download_worker = None
 
-            if not pending:
+        if download_worker is not None and download_worker.is_running:
+            queued = await download_worker.try_poll_once()
+            if not queued:
                 logger.debug("No pending downloads")
-                return
-
-            logger.info(f"Processing {len(pending)} pending downloads...")
+            return
 
+        db_manager = get_db_manager()
+        async for session in db_manager.get_session():
             # Create download engine
             download_engine = DownloadEngine(session)
 
             # Process the queue
             processed = await download_engine.process_download_queue()
 
-            logger.success(f"Download queue processed: {processed} downloads")
+            if processed:
+                logger.success(f"Download queue processed: {processed} downloads")
 
     except Exception as e:
         logger.error(f"Download queue processor failed: {e}")
@@ -294,18 +306,15 @@ async def cleanup_old_episodes_job():
                             f"Deleting {len(to_delete)} old episodes from {podcast.title}"
                         )
 
-                        for download, episode in to_delete:
-                            # Get file size before deletion
-                            if download.file_path:
-                                full_path = file_manager.base_path / download.file_path
-                                file_size = file_manager.get_file_size(full_path)
-                                if file_size:
-                                    total_space_freed += file_size
-
-                                # Delete the file
-                                file_manager.delete_file(full_path)
+                        # Delete the files in one batch, then their records
+                        _, space_freed = file_manager.delete_files(
+                            file_manager.base_path / download.file_path
+                            for download, _ in to_delete
+                            if download.file_path
+                        )
+                        total_space_freed += space_freed
 
-                            # Delete the download record
+                        for download, episode in to_delete:
                             await session.delete(download)
                             total_deleted += 1
 
@@ -5,8 +5,14 @@ This module provides safe HTML sanitization to prevent XSS attacks while
 preserving basic formatting from podcast RSS feeds.
 """
 
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
 import bleach
-from typing import Optional
 
 
 # Allowed HTML tags for podcast descriptions
@@ -24,6 +30,20 @@ ALLOWED_ATTRIBUTES = {
 # URL protocols that are allowed in links
 ALLOWED_PROTOCOLS = ['http', 'https', 'mailto']
 
+# Batches smaller than this are sanitized in-process; shipping them to worker
+# processes costs more than it saves
+PROCESS_POOL_MIN_BATCH = 16
+
+# Worker processes for sanitizing large batches (started by init_sanitize_pool)
+SANITIZE_WORKERS = os.cpu_count() or 1
+_sanitize_pool: Optional[ProcessPoolExecutor] = None
+_sanitize_pool_lock = threading.Lock()
+
+# Characters that make bleach.clean change its input: markup and entities,
+# CR (normalized by html5lib) and the C0 control characters bleach replaces
+# with '?'. Tab and LF pass through unchanged
+_NEEDS_CLEAN_RE = re.compile('[<>&\r\x00-\x08\x0b\x0c\x0e-\x1f]')
+
 
 def sanitize_html(html: Optional[str]) -> str:
     """
@@ -44,14 +64,18 @@ def sanitize_html(html: Optional[str]) -> str:
     if not html:
         return ""
 
-    # Clean the HTML
-    cleaned = bleach.clean(
-        html,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRIBUTES,
-        protocols=ALLOWED_PROTOCOLS,
-        strip=True,  # Strip disallowed tags instead of escaping
-    )
+    if _NEEDS_CLEAN_RE.search(html) is None:
+        # Plain text: cleaning would return it unchanged, so only linkify
+        cleaned = html
+    else:
+        # Clean the HTML
+        cleaned = bleach.clean(
+            html,
+            tags=ALLOWED_TAGS,
+            attributes=ALLOWED_ATTRIBUTES,
+            protocols=ALLOWED_PROTOCOLS,
+            strip=True,  # Strip disallowed tags instead of escaping
+        )
 
     # Linkify URLs that aren't already in <a> tags
     cleaned = bleach.linkify(
@@ -108,3 +132,68 @@ def truncate_html(html: Optional[str], max_length: int = 200) -> str:
     truncated_plain = plain[:max_length].rsplit(' ', 1)[0] + '...'
 
     return truncated_plain
+
+
+def _sanitize_batch(htmls: List[str]) -> List[str]:
+    """Sanitize a list of HTML strings (runs inside pool worker processes)."""
+    return [sanitize_html(html) for html in htmls]
+
+
+def sanitize_html_many(htmls: List[Optional[str]]) -> List[str]:
+    """
+    Sanitize many HTML strings, spreading large batches across CPU cores.
+
+    bleach is pure Python, so threads cannot run it in parallel; large batches
+    are split across a process pool instead.
+
+    Args:
+        htmls: Raw HTML contents
+
+    Returns:
+        Sanitized HTML, in the same order
+    """
+    # Without a started pool (e.g. outside the server) everything runs here
+    with _sanitize_pool_lock:
+        pool = _sanitize_pool
+    if pool is None or len(htmls) < PROCESS_POOL_MIN_BATCH:
+        return [sanitize_html(html) for html in htmls]
+
+    # One chunk per worker keeps pickling overhead to a few round trips
+    size = -(-len(htmls) // SANITIZE_WORKERS)
+    chunks = [[html or "" for html in htmls[i:i + size]] for i in range(0, len(htmls), size)]
+
+    sanitized: List[str] = []
+    for batch in pool.map(_sanitize_batch, chunks):
+        sanitized.extend(batch)
+    return sanitized
+
+
+def init_sanitize_pool() -> ProcessPoolExecutor:
+    """
+    Start the worker processes used by sanitize_html_many.
+
+    Workers come from a forkserver (or spawn, where forkserver is not
+    available) rather than a fork of the server process, which by then runs
+    the event loop, HTTP client and database threads.
+
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    global _sanitize_pool
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    with _sanitize_pool_lock:
+        if _sanitize_pool is None:
+            _sanitize_pool = ProcessPoolExecutor(
+                max_workers=SANITIZE_WORKERS,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _sanitize_pool
+
+
+def shutdown_sanitize_pool() -> None:
+    """Shut down the sanitization worker processes, if started."""
+    global _sanitize_pool
+    with _sanitize_pool_lock:
+        if _sanitize_pool is not None:
+            _sanitize_pool.shutdown()
+            _sanitize_pool = None
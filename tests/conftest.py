@@ -0,0 +1,48 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from podcastmanager.db.database import init_db
+from podcastmanager.db.models import Episode, Podcast
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Global database manager backed by a fresh SQLite file."""
+    manager = init_db(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await manager.create_tables()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+async def session(db_manager):
+    """Database session for arranging and checking test data."""
+    async with db_manager.async_session_maker() as session:
+        yield session
+
+
+@pytest.fixture
+async def podcast(session):
+    """A stored podcast with no episodes."""
+    podcast = Podcast(title="Show", rss_url="https://example.com/feed.xml")
+    session.add(podcast)
+    await session.commit()
+    return podcast
+
+
+@pytest.fixture
+async def episodes(session, podcast):
+    """Three stored episodes of the podcast fixture."""
+    episodes = [
+        Episode(
+            podcast_id=podcast.id,
+            title=f"Episode {i}",
+            guid=f"guid-{i}",
+            audio_url=f"https://example.com/{i}.mp3",
+        )
+        for i in range(3)
+    ]
+    session.add_all(episodes)
+    await session.commit()
+    return episodes
@@ -0,0 +1,19 @@
+"""Fixtures for API tests."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from podcastmanager.api.routes import router
+
+
+@pytest.fixture
+async def client(db_manager):
+    """HTTP client for the API routes, without the application lifespan."""
+    app = FastAPI()
+    app.include_router(router)
+    async with httpx.AsyncClient() as http:
+        app.state.http = http
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
@@ -0,0 +1,80 @@
+"""Tests for ETag handling on the podcast list and OPML export."""
+
+import pytest
+from lxml import etree
+from starlette.requests import Request
+
+from podcastmanager.api.routes import _etag_matches
+from podcastmanager.db.models import Podcast
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"old", "abc"', True),
+        ("*", True),
+        ('"old"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert _etag_matches(_request(header), '"abc"') is expected
+
+
+@pytest.mark.parametrize("path", ["/api/podcasts", "/api/opml/export"])
+async def test_matching_etag_returns_304(client, podcast, path):
+    response = await client.get(path)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("path", ["/api/podcasts", "/api/opml/export"])
+async def test_update_invalidates_etag(client, podcast, path):
+    response = await client.put(f"/api/podcasts/{podcast.id}", json={"max_episodes_to_keep": 7})
+    assert response.status_code == 200
+    etag = (await client.get(path)).headers["etag"]
+
+    # Within the same second as the previous update, so the tag must not
+    # depend on a whole-second timestamp
+    response = await client.put(f"/api/podcasts/{podcast.id}", json={"auto_download": False})
+    assert response.status_code == 200
+
+    response = await client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+async def test_delete_invalidates_etag(client, session, podcast):
+    session.add(Podcast(title="Other", rss_url="https://example.com/other.xml"))
+    await session.commit()
+    etag = (await client.get("/api/podcasts")).headers["etag"]
+
+    response = await client.delete(f"/api/podcasts/{podcast.id}")
+    assert response.status_code == 200
+
+    response = await client.get("/api/podcasts", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+async def test_export_with_control_characters(client, session):
+    session.add(Podcast(title="Bad\x0cTitle", rss_url="https://example.com/feed.xml"))
+    await session.commit()
+
+    response = await client.get("/api/opml/export")
+
+    assert response.status_code == 200
+    outline = etree.fromstring(response.content).find("body/outline")
+    assert outline.get("title") == "BadTitle"
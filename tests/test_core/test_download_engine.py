@@ -0,0 +1,121 @@
+"""Tests for download queuing."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from podcastmanager.core.download_engine import DownloadEngine, DownloadWorker
+from podcastmanager.db.models import Download
+from podcastmanager.services.file_manager import init_file_manager
+
+
+@pytest.fixture(autouse=True)
+def file_manager(tmp_path):
+    return init_file_manager(tmp_path / "downloads")
+
+
+class TestDownloadWorker:
+    def test_enqueue_skips_queued_downloads(self):
+        worker = DownloadWorker()
+
+        assert worker.enqueue(1) is True
+        assert worker.enqueue(1) is False
+        assert worker.enqueue(2) is True
+        assert worker._queue.qsize() == 2
+
+    async def test_download_can_be_queued_again_once_done(self, db_manager, monkeypatch):
+        performed = []
+
+        async def fake_download(self, download_id):
+            performed.append(download_id)
+            return True
+
+        monkeypatch.setattr(DownloadEngine, "download_episode", fake_download)
+        worker = DownloadWorker(max_concurrent=1)
+        worker.start()
+        try:
+            worker.enqueue(5)
+            await asyncio.wait_for(worker._queue.join(), timeout=5)
+            assert performed == [5]
+            assert worker.enqueue(5) is True
+            await asyncio.wait_for(worker._queue.join(), timeout=5)
+            assert performed == [5, 5]
+        finally:
+            await worker.stop()
+
+    async def test_failed_download_is_released(self, db_manager, monkeypatch):
+        async def broken_download(self, download_id):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(DownloadEngine, "download_episode", broken_download)
+        worker = DownloadWorker(max_concurrent=1)
+        worker.start()
+        try:
+            worker.enqueue(5)
+            await asyncio.wait_for(worker._queue.join(), timeout=5)
+            assert worker.enqueue(5) is True
+        finally:
+            await worker.stop()
+
+    async def test_poll_queues_only_new_pending_downloads(self, session, episodes):
+        session.add_all([
+            Download(episode_id=episodes[0].id, status="pending"),
+            Download(episode_id=episodes[1].id, status="completed"),
+            Download(episode_id=episodes[2].id, status="pending"),
+        ])
+        await session.commit()
+        worker = DownloadWorker()
+
+        assert await worker.try_poll_once() == 2
+        assert await worker.try_poll_once() == 0
+        assert worker._queue.qsize() == 2
+
+
+class TestInsertDownload:
+    async def test_inserts_new_record(self, session, episodes):
+        engine = DownloadEngine(session)
+
+        download = await engine._insert_download(episode_id=episodes[0].id, status="pending")
+        await session.commit()
+
+        assert download.id is not None
+        assert download.status == "pending"
+
+    @pytest.mark.parametrize("status", ["failed", "deleted"])
+    async def test_reactivates_inactive_record(self, session, episodes, status):
+        existing = Download(
+            episode_id=episodes[0].id,
+            status=status,
+            progress=0.4,
+            error_message="timed out",
+        )
+        session.add(existing)
+        await session.commit()
+        engine = DownloadEngine(session)
+
+        download = await engine._insert_download(episode_id=episodes[0].id, status="pending")
+        await session.commit()
+
+        assert download.id == existing.id
+        assert download.status == "pending"
+        assert download.progress == 0.0
+        assert download.error_message is None
+
+    @pytest.mark.parametrize("status", ["pending", "downloading", "completed"])
+    async def test_leaves_other_records_alone(self, session, episodes, status):
+        existing = Download(episode_id=episodes[0].id, status=status, progress=0.4)
+        session.add(existing)
+        await session.commit()
+        engine = DownloadEngine(session)
+
+        download = await engine._insert_download(episode_id=episodes[0].id, status="pending")
+        await session.commit()
+
+        assert download.id == existing.id
+        assert download.status == status
+        assert download.progress == 0.4
+        count = await session.scalar(
+            select(func.count()).select_from(Download).where(Download.episode_id == episodes[0].id)
+        )
+        assert count == 1
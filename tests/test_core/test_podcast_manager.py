@@ -0,0 +1,65 @@
+"""Tests for episode discovery."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from podcastmanager.core import podcast_manager
+from podcastmanager.core.podcast_manager import PodcastManager
+from podcastmanager.db.models import Episode
+
+
+def _feed_entries(count):
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            "title": f"Episode {i}",
+            "description": None,
+            "guid": f"guid-{i}",
+            "pub_date": start + timedelta(days=i),
+            "duration": None,
+            "audio_url": f"https://example.com/{i}.mp3",
+            "file_size": None,
+            "file_type": "audio/mpeg",
+            "episode_number": None,
+            "season_number": None,
+        }
+        for i in range(count)
+    ]
+
+
+async def test_discover_looks_up_guids_in_chunks(session, podcast, episodes, monkeypatch):
+    monkeypatch.setattr(podcast_manager, "GUID_LOOKUP_CHUNK_SIZE", 100)
+    podcast.max_episodes_to_keep = 5000
+    # Already stored GUIDs fall in different lookup chunks
+    session.add_all([
+        Episode(
+            podcast_id=podcast.id,
+            title="Old",
+            guid=f"guid-{i}",
+            audio_url="https://example.com/old.mp3",
+        )
+        for i in (150, 999)
+    ])
+    await session.commit()
+
+    added = await PodcastManager(session)._discover_episodes(podcast, _feed_entries(1200))
+    await session.commit()
+
+    assert added == 1200 - 5
+    stored = await session.scalar(
+        select(func.count()).select_from(Episode).where(Episode.podcast_id == podcast.id)
+    )
+    assert stored == 1200
+
+
+async def test_discover_keeps_newest_new_episodes(session, podcast, episodes):
+    added = await PodcastManager(session)._discover_episodes(podcast, _feed_entries(10))
+    await session.commit()
+
+    assert added == podcast.max_episodes_to_keep
+    known = [episode.guid for episode in episodes]
+    result = await session.execute(
+        select(Episode.guid).where(Episode.podcast_id == podcast.id, Episode.guid.not_in(known))
+    )
+    assert sorted(result.scalars().all()) == ["guid-7", "guid-8", "guid-9"]
@@ -0,0 +1,126 @@
+"""Tests for feed fetching and the feed cache."""
+
+import asyncio
+
+import feedparser
+import httpx
+import pytest
+
+from podcastmanager.core.rss_parser import RSSParser
+
+FEED_URL = "https://example.com/feed.xml"
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Show</title>
+    <link>https://example.com/</link>
+    <item>
+      <title>Episode 1</title>
+      <guid>guid-1</guid>
+      <pubDate>Mon, 06 Jan 2025 12:00:00 GMT</pubDate>
+      <enclosure url="https://example.com/1.mp3" length="1000" type="audio/mpeg"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+@pytest.fixture
+def responses():
+    """Responses served to the parser, in order."""
+    return []
+
+
+@pytest.fixture
+async def client(responses):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        client.requests = requests
+        yield client
+
+
+async def test_fetch_extracts_metadata_and_episodes(client, responses):
+    responses.append(httpx.Response(200, content=FEED))
+
+    metadata, episodes = await RSSParser().fetch_feed(FEED_URL, client=client)
+
+    assert metadata["title"] == "Show"
+    assert [episode["audio_url"] for episode in episodes] == ["https://example.com/1.mp3"]
+
+
+async def test_cache_keeps_only_extracted_content(client, responses):
+    responses.append(httpx.Response(200, content=FEED, headers={"ETag": '"v1"'}))
+    parser = RSSParser()
+
+    parsed = await parser.fetch_feed(FEED_URL, client=client)
+
+    cached = parser._feed_cache[FEED_URL]
+    assert cached.parsed is parsed
+    assert not any(
+        isinstance(getattr(cached, name), feedparser.FeedParserDict) for name in cached.__slots__
+    )
+
+
+async def test_not_modified_returns_previous_result(client, responses):
+    responses.append(httpx.Response(200, content=FEED, headers={"ETag": '"v1"'}))
+    responses.append(httpx.Response(304))
+    parser = RSSParser()
+
+    first = await parser.fetch_feed(FEED_URL, client=client)
+    second = await parser.fetch_feed(FEED_URL, client=client)
+
+    assert second is first
+    assert client.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_unchanged_body_is_not_parsed_again(client, responses, monkeypatch):
+    responses.append(httpx.Response(200, content=FEED))
+    responses.append(httpx.Response(200, content=FEED))
+    parser = RSSParser()
+
+    first = await parser.fetch_feed(FEED_URL, client=client)
+    monkeypatch.setattr(feedparser, "parse", pytest.fail)
+    second = await parser.fetch_feed(FEED_URL, client=client)
+
+    assert second is first
+
+
+async def test_iter_feeds_bounds_fetched_but_unconsumed_feeds():
+    started = []
+
+    async def handler(request):
+        started.append(request.url)
+        await asyncio.sleep(0)
+        return httpx.Response(200, content=FEED)
+
+    urls = [f"https://example.com/{i}.xml" for i in range(10)]
+    seen = []
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        async for index, parsed in RSSParser().iter_feeds(urls, client=client, concurrency=3):
+            assert len(started) - len(seen) <= 3
+            seen.append(index)
+            assert parsed[0]["title"] == "Show"
+            # Slow consumer: fetches must not run ahead of it
+            await asyncio.sleep(0.01)
+
+    assert sorted(seen) == list(range(10))
+
+
+async def test_iter_feeds_reports_failures_as_none():
+    def handler(request):
+        if request.url.path == "/bad.xml":
+            return httpx.Response(500)
+        return httpx.Response(200, content=FEED)
+
+    urls = [FEED_URL, "https://example.com/bad.xml"]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        results = dict([item async for item in RSSParser().iter_feeds(urls, client=client)])
+
+    assert results[0] is not None
+    assert results[1] is None
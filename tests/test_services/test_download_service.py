@@ -0,0 +1,85 @@
+"""Tests for the download service."""
+
+import asyncio
+
+import pytest
+
+from podcastmanager.db.models import Download
+from podcastmanager.services import download_service
+from podcastmanager.services.download_service import DownloadService
+
+
+@pytest.fixture
+def service(db_manager, monkeypatch):
+    monkeypatch.setattr(download_service, "PROGRESS_FLUSH_INTERVAL", 0.01)
+    service = DownloadService()
+    service._progress_session_factory = db_manager.async_session_maker
+    return service
+
+
+@pytest.fixture
+async def download(session, episodes):
+    download = Download(episode_id=episodes[0].id, status="downloading", progress=0.0)
+    session.add(download)
+    await session.commit()
+    return download
+
+
+async def _stored(session, download_id):
+    session.expire_all()
+    return await session.get(Download, download_id)
+
+
+async def test_flusher_writes_latest_progress(service, session, download):
+    service._queue_progress(download.id, 0.2)
+    service._queue_progress(download.id, 0.5)
+    await asyncio.wait_for(service._flusher_task, timeout=5)
+
+    assert (await _stored(session, download.id)).progress == 0.5
+
+
+async def test_late_flush_keeps_final_state(service, session, download):
+    service._queue_progress(download.id, 0.5)
+    # The download finishes through another session before the batch is written
+    download.status = "completed"
+    download.progress = 1.0
+    await session.commit()
+
+    await service.flush_progress()
+
+    stored = await _stored(session, download.id)
+    assert stored.status == "completed"
+    assert stored.progress == 1.0
+
+
+async def test_direct_write_drops_queued_progress(service, session, download):
+    service._queue_progress(download.id, 0.5)
+
+    async with service._progress_session_factory() as write_session:
+        await service._write_download(download.id, write_session, status="failed", progress=0.0)
+    assert download.id not in service._pending_progress
+
+    # A retry makes the row active again before the batch is written; the
+    # stale value from the previous attempt must not land on it
+    stored = await _stored(session, download.id)
+    stored.status = "downloading"
+    await session.commit()
+
+    await asyncio.wait_for(service._flusher_task, timeout=5)
+    assert (await _stored(session, download.id)).progress == 0.0
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://cdn.example.com/ep.mp3", False),
+        ("https://cdn.example.com/ep.mp3?Expires=1&Signature=abc", True),
+        ("https://cdn.example.com/signature=abc/ep.mp3", False),
+        ("https://dts.podtrac.com/redirect.mp3/cdn.example.com/ep.mp3", True),
+        ("https://cdn.example.com/redirect.mp3/dts.PODTRAC.com/ep.mp3", True),
+        ("https://cdn.example.com/r?url=https%3A%2F%2Fchartable.com%2Fep.mp3", True),
+        ("https://cdn.example.com/ep.mp3?via=megaphone.fm", True),
+    ],
+)
+def test_is_signed_url(url, expected):
+    assert DownloadService()._is_signed_url(url) is expected
@@ -0,0 +1,112 @@
+"""Tests for OPML import and export."""
+
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from lxml import etree
+
+from podcastmanager.services.opml import OPMLService
+
+
+def _podcast(**overrides):
+    values = {
+        "title": "Show",
+        "rss_url": "https://example.com/feed.xml",
+        "description": None,
+        "website_url": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_stream_strips_xml_invalid_characters():
+    podcasts = [
+        _podcast(
+            title="Bad\x0cTitle\x00",
+            description="line\x01one\ttab",
+            website_url="https://example.com/\x1f",
+        )
+    ]
+
+    content = await _collect(
+        OPMLService.generate_opml_stream(_aiter(podcasts), title="Subs\x08")
+    )
+
+    root = etree.fromstring(content)
+    assert root.findtext("head/title") == "Subs"
+    outline = root.find("body/outline")
+    assert outline.get("text") == "BadTitle"
+    assert outline.get("title") == "BadTitle"
+    assert outline.get("description") == "lineone\ttab"
+    assert outline.get("htmlUrl") == "https://example.com/"
+
+
+async def test_stream_round_trips_through_parser():
+    podcasts = [_podcast(title=f"Show {i}", rss_url=f"https://example.com/{i}.xml") for i in range(250)]
+
+    content = await _collect(OPMLService.generate_opml_stream(_aiter(podcasts)))
+
+    parsed = OPMLService.parse_opml(content)
+    assert [p["rss_url"] for p in parsed] == [p.rss_url for p in podcasts]
+
+
+def test_generate_strips_xml_invalid_characters():
+    podcasts = [_podcast(title="Bad\x0bTitle", description="d\x02esc")]
+
+    content = OPMLService.generate_opml(podcasts, title="Subs\x1b")
+
+    root = etree.fromstring(content.encode("utf-8"))
+    assert root.findtext("head/title") == "Subs"
+    outline = root.find("body/outline")
+    assert outline.get("title") == "BadTitle"
+    assert outline.get("description") == "desc"
+
+
+NESTED_OPML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<opml version="2.0">
+  <head><title>Subscriptions</title></head>
+  <body>
+    <outline text="Technology">
+      <outline type="rss" text="One" xmlUrl="https://example.com/1.xml"/>
+      <outline text="Deeper">
+        <outline type="rss" text="Two" xmlUrl="https://example.com/2.xml"
+                 htmlUrl="https://example.com/two"/>
+      </outline>
+      <outline type="rss" text="Three" xmlUrl="https://example.com/3.xml"/>
+    </outline>
+    <outline type="rss" text="Four" xmlUrl="https://example.com/4.xml"/>
+    <outline type="link" text="Not a feed" url="https://example.com/"/>
+  </body>
+</opml>
+"""
+
+
+def test_parse_stream_finds_nested_outlines():
+    podcasts = OPMLService.parse_opml_stream(BytesIO(NESTED_OPML))
+
+    assert [p["title"] for p in podcasts] == ["One", "Two", "Three", "Four"]
+    assert podcasts[1]["website_url"] == "https://example.com/two"
+
+
+def test_parse_stream_matches_parse_opml():
+    assert OPMLService.parse_opml_stream(BytesIO(NESTED_OPML)) == OPMLService.parse_opml(NESTED_OPML)
+
+
+def test_parse_stream_rejects_other_root():
+    with pytest.raises(ValueError):
+        OPMLService.parse_opml_stream(BytesIO(b"<rss><outline xmlUrl='x'/></rss>"))
+
+
+def test_parse_stream_rejects_missing_outlines():
+    with pytest.raises(ValueError):
+        OPMLService.parse_opml_stream(BytesIO(b"<opml><body/></opml>"))
@@ -0,0 +1,68 @@
+"""Tests for the HTML sanitizer."""
+
+import bleach
+import pytest
+
+from podcastmanager.utils.html_sanitizer import (
+    ALLOWED_ATTRIBUTES,
+    ALLOWED_PROTOCOLS,
+    ALLOWED_TAGS,
+    PROCESS_POOL_MIN_BATCH,
+    init_sanitize_pool,
+    sanitize_html,
+    sanitize_html_many,
+    shutdown_sanitize_pool,
+)
+
+
+def _bleach_sanitize(html: str) -> str:
+    """Sanitize without the plain-text fast path."""
+    cleaned = bleach.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        protocols=ALLOWED_PROTOCOLS,
+        strip=True,
+    )
+    return bleach.linkify(cleaned, parse_email=True)
+
+
+def test_fast_path_matches_bleach_for_every_code_point():
+    """Skipping bleach.clean must never change the result."""
+    mismatches = []
+    for cp in range(0x3000):
+        text = f"x{chr(cp)}y"
+        if sanitize_html(text) != _bleach_sanitize(text):
+            mismatches.append(hex(cp))
+    assert mismatches == []
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        ("x\x0cy", "x?y"),
+        ("a\x01b\x1fc", "a?b?c"),
+        ("tab\tand\nnewline", "tab\tand\nnewline"),
+    ],
+)
+def test_control_characters(html, expected):
+    assert sanitize_html(html) == expected
+
+
+def test_markup_is_cleaned():
+    assert sanitize_html('<p onclick="x()">hi</p><script>bad()</script>') == "<p>hi</p>bad()"
+
+
+def test_sanitize_many_matches_sanitize_html():
+    htmls = [f"<p onclick='x'>Item {i}</p>\x0c" for i in range(PROCESS_POOL_MIN_BATCH * 2)]
+    htmls.append(None)
+    expected = [sanitize_html(html) for html in htmls]
+
+    # Without a started pool everything is sanitized in-process
+    assert sanitize_html_many(htmls) == expected
+
+    init_sanitize_pool()
+    try:
+        assert sanitize_html_many(htmls) == expected
+    finally:
+        shutdown_sanitize_pool()